@@ -16,7 +16,7 @@ from cogs.base import ImprovedCog
 # REFACTOR: Import helpers for sending messages
 from utilities import ensure_requirements, helpers
 from utilities.config import get_config
-from utilities.exception_manager import create_detailed_error_log
+from utilities.exception_manager import create_detailed_error_log_async
 from utilities.formatter import ConsoleFormatter, FileFormatter
 # REFACTOR: Import embed templates for error handling
 from utilities.embeds import error_embed, warning_embed
@@ -232,7 +232,7 @@ class BotTemplate(commands.Bot):
 
         if self.configuration.logging.output_folder:
             command_name = interaction.command.name if interaction.command else 'Unknown'
-            error_saved_to = create_detailed_error_log(
+            error_saved_to = await create_detailed_error_log_async(
                 self.configuration.logging.output_folder, command_name, exc_type, error, tb
             )
             log.info(f"Traceback saved to {error_saved_to!r}")
@@ -295,7 +295,7 @@ class BotTemplate(commands.Bot):
         tb = original_error.__traceback__
 
         if self.configuration.logging.output_folder:
-            error_saved_to = create_detailed_error_log(
+            error_saved_to = await create_detailed_error_log_async(
                 self.configuration.logging.output_folder, ctx.command.name, exc_type, exc_value, tb
             )
             log.info(f"Traceback saved to {error_saved_to!r}")
@@ -14,19 +14,25 @@ It offers:
 - Ability to view bot statistics/uptime
 """
 
+import ast
 import importlib
 import io
+import os
 import sys
 import difflib
-import textwrap
-import traceback
+import functools
+from bisect import bisect_left
+from collections import deque
 from contextlib import redirect_stdout
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass, field
+from itertools import islice
+from types import CodeType
+from typing import Callable, Deque, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple, Union
 
 from discord.ext import commands
 from discord import app_commands
 from discord.ext.commands import CommandError
-from discord import ClientException
+from discord import ClientException, DMChannel, Embed, File, HTTPException
 
 from cogs.base import CogTemplate, ImprovedCog
 from utilities import helpers
@@ -35,6 +41,351 @@ from utilities.embeds import (
     CustomEmbed, custom_embed
 )
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional, fall back to difflib
+    fuzz = process = None
+
+
+def _close_matches(word: str, possibilities, n: int, cutoff: float) -> List[str]:
+    """
+    Get up to n of the best possibilities scoring at least cutoff (0-1) against word.
+
+    Uses rapidfuzz when it is installed and falls back to difflib otherwise.
+    """
+    if process is not None:
+        return [match for match, _score, _index in process.extract(
+            word, possibilities, scorer=fuzz.WRatio, limit=n, score_cutoff=cutoff * 100
+        )]
+
+    # Prune candidates before difflib scores them. A length mismatch alone can rule a candidate
+    # out (ratio <= 2 * shorter / total), which never changes the result; get_close_matches then
+    # applies its own real_quick_ratio/quick_ratio upper bounds before the full ratio
+    word_length = len(word)
+    candidates = [
+        candidate for candidate in possibilities
+        if 2 * min(word_length, len(candidate)) >= cutoff * (word_length + len(candidate))
+    ]
+    return difflib.get_close_matches(word, candidates, n=n, cutoff=cutoff)
+
+
+# Most eval stdout kept in memory; anything past 1990 characters is uploaded as a file,
+# so this only needs to stay well under Discord's attachment size limit
+_EVAL_OUTPUT_CAP = 1_000_000
+
+
+class _BoundedIO(io.TextIOBase):
+    """A write-only text stream that keeps only the last cap characters written to it."""
+
+    def __init__(self, cap: int):
+        super().__init__()
+        self._chunks: Deque[str] = deque()
+        self._length = 0
+        self._cap = cap
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        written = len(s)
+        if written > self._cap:
+            s = s[-self._cap:]
+        self._chunks.append(s)
+        self._length += len(s)
+        # Drop whole chunks from the front while the remaining ones still cover the cap
+        while self._length - len(self._chunks[0]) >= self._cap:
+            self._length -= len(self._chunks.popleft())
+        return written
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)[-self._cap:]
+
+
+def _cleanup_code(content: str) -> str:
+    """
+    Strip a surrounding ```py code block (or inline `code`) from an eval body.
+
+    Args:
+        content (str): The raw eval body
+
+    Returns:
+        str: The code inside the fences
+    """
+    if len(content) >= 6 and content.startswith('```') and content.endswith('```'):
+        # Slice between the opening fence line (with its language tag) and the closing fence
+        first = content.find('\n')
+        if first == -1:
+            return content[3:-3]
+        last = content.rfind('\n')
+        return content[first + 1:last] if last > first else content[first + 1:-3]
+    return content.strip('` \n')
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_eval(body: str) -> CodeType:
+    """
+    Compile an eval body wrapped in an async function named func.
+
+    Code objects are cached per body, so re-running the same snippet skips the parser and compiler.
+    The body is parsed as-is and grafted into the function's AST, rather than re-indented as text,
+    so multi-line strings are left untouched and line numbers match the submitted code.
+
+    Args:
+        body (str): The code to compile
+
+    Returns:
+        CodeType: Code that defines func when executed
+    """
+    # Wrap the code in an async function to allow 'await'
+    wrapper = ast.parse("async def func():\n  pass", "<eval>")
+    body_statements = ast.parse(body, "<eval>").body
+    if body_statements:
+        wrapper.body[0].body = body_statements
+    return compile(wrapper, "<eval>", "exec")
+
+
+async def _send_eval_output(channel: DMChannel, payload: str, filename: str) -> None:
+    """
+    Send eval output as a code block, or as a file attachment if it is too long for a message.
+
+    Args:
+        channel (DMChannel): The channel to send the output to
+        payload (str): The output to send
+        filename (str): The attachment's file name if the output is uploaded as a file
+    """
+    if len(payload) <= 1990:
+        await channel.send(f'```py\n{payload}\n```')
+    else:
+        # Too long for a message, upload it as a file instead
+        await channel.send(file=File(io.BytesIO(payload.encode()), filename=filename))
+
+
+# Commands with dedicated help pages, used for "Did you mean?" suggestions
+_HELP_COMMANDS = ('help', 'list', 'cog', 'load', 'unload', 'reload', 'tree', 'sync', 'reset')
+
+
+@functools.lru_cache(maxsize=256)
+def _render_help(template: str, prefix: str) -> str:
+    """Substitute the invoking prefix into a help text template, cached per (template, prefix) pair."""
+    return template.replace("{prefix}", prefix)
+
+
+# General `m help` page; "{prefix}" is replaced with the invoking prefix
+_GENERAL_HELP_DESCRIPTION = (
+    "**Bot Administration & Maintenance Commands**\n"
+    "Use `{prefix}m help <command>` for detailed help on specific commands.\n"
+    "**Aliases:** `{prefix}management` or `{prefix}m`"
+)
+_GENERAL_HELP_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("📋 General Commands", (
+        "`{prefix}m help [command]` - Show this help or help for a specific command\n"
+    )),
+    ("🧩 Cog Management", (
+        "`{prefix}m [c]og [l]oad <cog>` - Load a cog by name\n"
+        "`{prefix}m [c]og [u]nload <cog>` - Unload a cog by name\n"
+        "`{prefix}m [c]og [r]eload <cog>` - Reload a cog by name\n"
+        "`{prefix}m [c]og list (also ls)` - List all cogs and their status"
+    )),
+    ("🌳 Command Tree Management", (
+        "`{prefix}m [t]ree [s]ync [guild_id]` - Sync slash commands globally or to a guild\n"
+        "`{prefix}m [t]ree [r]eset [guild_id]` - Reset slash commands globally or for a guild\n"
+        "`{prefix}m [t]ree [l]ist` - List all registered slash commands"
+    )),
+    ("🔒 Security Note", "These commands are restricted to authorized administrators only."),
+)
+
+# Help pages for `m help <command>`, keyed by page name. Each page is
+# (title, description, aliases, fields); "{prefix}" in field values is replaced with the invoking prefix
+_HELP_PAGES: Dict[str, Tuple[str, str, str, Tuple[Tuple[str, str], ...]]] = {
+    'help': (
+        "Help Command",
+        "Display help information for management commands.",
+        "h",
+        (
+            ("Usage", "`{prefix}m help [command]`"),
+            ("Examples", (
+                "`{prefix}m help` - Show general help\n"
+                "`{prefix}m help cog` - Show help for cog commands\n"
+                "`{prefix}m help sync` - Show help for sync command"
+            )),
+        ),
+    ),
+    'list': (
+        "List Cogs Command",
+        "Display all available cogs and their current status (Loaded/Disabled/Not Loaded).",
+        "status, ls",
+        (
+            ("Usage", "`{prefix}m cog list` (or `m c ls`)"),
+            ("Status Types", (
+                "✅ **Loaded** - Cog is currently active\n"
+                "❌ **Disabled** - Cog is disabled in config\n"
+                "⚠️ **Not Loaded** - Cog is available but not loaded"
+            )),
+        ),
+    ),
+    'cog': (
+        "Cog Management Commands",
+        "Manage bot cogs with loading, unloading, and reloading functionality.",
+        "c",
+        (
+            ("Subcommands", (
+                "`{prefix}m cog load <name>` - Load a cog\n"
+                "`{prefix}m cog unload <name>` - Unload a cog\n"
+                "`{prefix}m cog reload <name>` - Reload a cog\n"
+                "`{prefix}m cog list` - List all cogs"
+            )),
+            ("Cog Name Matching", (
+                "• Template name (e.g., `echo`, `management`)\n"
+                "• Class name (e.g., `Echo`, `Management`)\n"
+                "• Module path (e.g., `cogs.echo`)\n"
+                "• Partial matches with suggestions"
+            )),
+        ),
+    ),
+    'load': (
+        "Load Cog Command",
+        "Load a cog by template name, class name, or module name.",
+        "l",
+        (
+            ("Usage", "`{prefix}m cog load <cog_name>`"),
+            ("Features", (
+                "• Smart name matching with suggestions\n"
+                "• Prevents loading already loaded cogs\n"
+                "• Validates cog type before loading\n"
+                "• Detailed error reporting"
+            )),
+        ),
+    ),
+    'unload': (
+        "Unload Cog Command",
+        "Unload a currently loaded cog.",
+        "u",
+        (
+            ("Usage", "`{prefix}m cog unload <cog_name>`"),
+            ("Protection", "The Management cog cannot be unloaded to prevent loss of administrative access."),
+        ),
+    ),
+    'reload': (
+        "Reload Cog Command",
+        "Safely reload a cog with automatic rollback on failure.",
+        "r",
+        (
+            ("Usage", (
+                "`{prefix}m cog reload <cog_name>` - Reload if the cog's source changed\n"
+                "`{prefix}m cog reload <cog_name> --force` - Always re-execute the module"
+            )),
+            ("Safety Features", (
+                "• Automatic rollback on reload failure\n"
+                "• Module state preservation\n"
+                "• Original cog instance backup\n"
+                "• Comprehensive error handling"
+            )),
+        ),
+    ),
+    'tree': (
+        "Command Tree Management",
+        "Manage Discord slash commands (application commands).",
+        "t",
+        (
+            ("Subcommands", (
+                "`{prefix}m tree sync [guild_id]` - Sync commands\n"
+                "`{prefix}m tree reset [guild_id]` - Reset commands\n"
+                "`{prefix}m tree list` - List all commands"
+            )),
+            ("Guild vs Global", (
+                "**No guild_id** = Global sync (affects all servers, up to 1 hour delay)\n"
+                "**With guild_id** = Guild sync (immediate, affects only that server)"
+            )),
+        ),
+    ),
+    'sync': (
+        "Sync Command Tree",
+        "Synchronize Discord slash commands globally or to a specific guild.",
+        "s",
+        (
+            ("Usage", (
+                "`{prefix}m tree sync` - Sync globally\n"
+                "`{prefix}m tree sync <guild_id>` - Sync to specific guild"
+            )),
+            ("Important Notes", (
+                "• Global sync can take up to 1 hour to propagate\n"
+                "• Guild sync is immediate\n"
+                "• Use guild sync for testing new commands"
+            )),
+        ),
+    ),
+    'reset': (
+        "Reset Command Tree",
+        "Clear all Discord slash commands and re-sync.",
+        "r",
+        (
+            ("Usage", (
+                "`{prefix}m tree reset` - Reset globally\n"
+                "`{prefix}m tree reset <guild_id>` - Reset for specific guild"
+            )),
+            ("⚠️ Warning", "This will remove ALL slash commands before re-syncing. Use with caution!"),
+        ),
+    ),
+    'list_tree': (
+        "List Tree Commands",
+        "List all registered Discord slash commands.",
+        "l",
+        (
+            ("Usage", "`{prefix}m tree list` (or `m t l`)"),
+            ("Functionality", (
+                "Groups all commands by their cog and shows their description. "
+                "Automatically splits into multiple messages if the list is too long."
+            )),
+        ),
+    ),
+}
+
+# Maps every accepted `m help <command>` spelling to its _HELP_PAGES key
+_HELP_ALIASES: Dict[str, str] = {
+    'help': 'help', 'h': 'help',
+    'list': 'list', 'status': 'list', 'ls': 'list',
+    'cog': 'cog', 'c': 'cog',
+    'load': 'load', 'l': 'load',
+    'unload': 'unload', 'u': 'unload',
+    'reload': 'reload', 'r': 'reload',
+    'tree': 'tree', 't': 'tree',
+    'sync': 'sync', 's': 'sync',
+    'reset': 'reset',
+    'list_tree': 'list_tree', 'list tree': 'list_tree', 'tree list': 'list_tree',
+}
+
+# Every accepted spelling resolved straight to its help page, so a lookup is a single dict probe
+_HELP_DISPATCH = {alias: _HELP_PAGES[page_name] for alias, page_name in _HELP_ALIASES.items()}
+
+
+@dataclass(slots=True)
+class CogEntry:
+    """A cog from the configuration, as tracked by the Management registry."""
+    module: str  # Full module path, e.g. cogs.echo
+    class_name: str  # Name of the ImprovedCog subclass in the module
+    template_name: str  # The cog's template name (primary identifier)
+    enabled: bool  # Whether the cog is enabled in the configuration
+    data: dict  # The raw configuration data for the cog
+    cog_class: Optional[type] = None  # The resolved cog class, cached so loads skip the import machinery
+    # Display strings are fixed for the registry's lifetime, so build them once
+    display: str = field(init=False)
+    footer_module: str = field(init=False)
+    logger_name: str = field(init=False)  # Child logger name, matching the one bot.py gives the cog
+
+    def __post_init__(self):
+        self.display = f"`{self.template_name}` ({self.module}.{self.class_name})"
+        self.footer_module = f"Module: {self.module}.{self.class_name}"
+        self.logger_name = f"cogs[{self.module}]"
+
+
+# Embed field names for list_cogs, indexed by status bucket
+_COG_STATUS_FIELDS = ("✅ Loaded Cogs", "❌ Disabled Cogs", "⚠️ Not Loaded Cogs")
+
+
+def _plural(count: int, noun: str) -> str:
+    """Format a count with a naively pluralized noun, e.g. "1 command" or "3 commands"."""
+    return f"{count} {noun}{'s' if count != 1 else ''}"
+
 
 class Management(ImprovedCog):
     """
@@ -52,9 +403,18 @@ class Management(ImprovedCog):
     Attributes:
         bagel_id (int): The Discord user ID with full administrative privileges
         template (CogTemplate): Metadata template for this cog
-        available_cogs (Dict[str, Dict]): Registry of all available cogs from configuration
+        available_cogs (Dict[str, CogEntry]): Registry of all available cogs from configuration
         cog_lookup (Dict[str, str]): Lookup table mapping various names to template names
+        cog_lookup_ci (Dict[str, str]): Lowercased cog_lookup, used for all name resolution
         class_to_template_lookup (Dict[str, str]): Reverse lookup: ClassName -> template_name
+        _class_to_entry (Dict[str, CogEntry]): Reverse lookup: ClassName -> cog entry
+        _lookup_keys_cache (Tuple[str, ...]): Snapshot of cog_lookup_ci keys for fuzzy matching
+        _prefix_index (Tuple[str, ...]): Sorted cog_lookup_ci keys for prefix matching
+        _resolve_cache (Dict[str, Optional[Union[str, Tuple[str, ...]]]]): Memoized _resolve_cog_name results,
+            fuzzy suggestions included
+        _module_mtimes (Dict[str, Optional[float]]): Source mtime of each module as of its last reload
+        _bagel_dm (Optional[DMChannel]): Cached DM channel with bagel_id, opened on first use
+        _eval_base_env (Dict[str, object]): Snapshot of this module's globals used as the base eval namespace
     """
 
     # Discord user ID with full administrative privileges
@@ -80,12 +440,30 @@ class Management(ImprovedCog):
         """
         super().__init__(bot, logger)
         # Registry of unique cog entries by template name
-        self.available_cogs: Dict[str, Dict] = {}
+        self.available_cogs: Dict[str, CogEntry] = {}
         # Lookup table: various names -> template name
         self.cog_lookup: Dict[str, str] = {}
+        # Lookup table: lowercased names -> template name
+        self.cog_lookup_ci: Dict[str, str] = {}
         # REFACTOR: Added reverse lookup for performance
         # Lookup table: ClassName -> template_name
         self.class_to_template_lookup: Dict[str, str] = {}
+        # Lookup table: ClassName -> cog entry
+        self._class_to_entry: Dict[str, CogEntry] = {}
+        # Snapshot of cog_lookup_ci keys, rebuilt with the registry
+        self._lookup_keys_cache: Tuple[str, ...] = ()
+        # Sorted cog_lookup_ci keys, searched with bisect for prefix matches
+        self._prefix_index: Tuple[str, ...] = ()
+        # Memoized registry name resolutions, cleared whenever the registry is rebuilt
+        self._resolve_cache: Dict[str, Optional[Union[str, Tuple[str, ...]]]] = {}
+        # IDs allowed to run management commands, resolved once on cog load
+        self._owner_ids: FrozenSet[int] = frozenset({self.bagel_id})
+        # Source file mtime per module name, recorded whenever reload_cog (re)executes a module
+        self._module_mtimes: Dict[str, Optional[float]] = {}
+        # DM channel with bagel_id, opened lazily by _get_bagel_dm
+        self._bagel_dm: Optional[DMChannel] = None
+        # Module globals are fixed once imported, so copy them once for every eval to build on
+        self._eval_base_env: Dict[str, object] = dict(globals())
 
     async def cog_load(self):
         """
@@ -96,127 +474,252 @@ class Management(ImprovedCog):
         the initialization status.
         """
         await self._build_cog_registry()
+        self._owner_ids = frozenset({self.bagel_id, *await self._resolve_owner_ids()})
         self.logger.info(f"Management cog is now loaded with {len(self.available_cogs)} available cogs.")
 
+    async def _resolve_owner_ids(self) -> Set[int]:
+        """
+        Resolve the IDs of the bot's owner(s).
+
+        Uses the owners set on the bot if available, otherwise fetches
+        the application info (team members or the single owner).
+
+        Returns:
+            Set[int]: The owner IDs, or an empty set if they could not be resolved
+        """
+        if self.bot.owner_id:
+            return {self.bot.owner_id}
+        if self.bot.owner_ids:
+            return set(self.bot.owner_ids)
+
+        try:
+            app_info = await self.bot.application_info()
+        except HTTPException as e:
+            self.logger.warning(f"Could not resolve bot owners: {e}")
+            return set()
+
+        if app_info.team:
+            return {member.id for member in app_info.team.members}
+        return {app_info.owner.id}
+
     async def _build_cog_registry(self):
         """
         Build a comprehensive registry of all available cogs from configuration.
 
         This method parses the bot configuration to create:
         1. A primary registry (available_cogs) keyed by template name
-        2. A lookup table (cog_lookup) for various naming schemes
+        2. A lookup table (cog_lookup) for various naming schemes, plus a lowercased copy (cog_lookup_ci)
         3. A reverse lookup table (class_to_template_lookup) for performance
 
         The registry enables flexible cog identification by template name,
         class name, module name, or partial matches.
         """
+        self._resolve_cache = {}
         self.available_cogs = {}
         self.cog_lookup = {}
+        self.cog_lookup_ci = {}
         self.class_to_template_lookup = {}  # REFACTOR: Initialize new lookup
+        self._class_to_entry = {}
 
         for cog_info in self.bot.configuration.cogs:
-            cog_info = dict(cog_info)
-            cog_module = list(cog_info.keys())[0]
-            cog_data = dict(cog_info[cog_module])
-            cog_classname = cog_data["class"]
+            # Each entry is a single-key mapping ({module: data}); read it without copying
+            cog_module = next(iter(cog_info))
+            cog_data = cog_info[cog_module]
+            # Names are interned so comparisons against them (e.g. bot.cogs keys) can match on identity
+            cog_module = sys.intern(cog_module)
+            cog_classname = sys.intern(cog_data["class"])
             enabled = cog_data.get("enabled", True)
+            configured_template_name = cog_data.get("template_name")
 
-            # Attempt to retrieve the cog's template name by importing temporarily
-            try:
-                module = importlib.import_module(cog_module)
-                cog_class = getattr(module, cog_classname)
+            if not enabled and configured_template_name and cog_module not in sys.modules:
+                # A disabled cog with a configured template name doesn't need its module executed;
+                # load_cog resolves the class on demand if it is loaded later
+                cog_template_name = configured_template_name
+                cog_class = None
+            else:
+                # Attempt to retrieve the cog's template name by importing temporarily
+                try:
+                    # Skip the import machinery for modules that are already loaded
+                    module = sys.modules.get(cog_module) or importlib.import_module(cog_module)
+                    cog_class = getattr(module, cog_classname)
 
-                if hasattr(cog_class, 'template') and cog_class.template:
-                    cog_template_name = cog_class.template.name
-                else:
-                    # Fallback to lowercased class name if no template
+                    if hasattr(cog_class, 'template') and cog_class.template:
+                        cog_template_name = cog_class.template.name
+                    else:
+                        # Fallback to lowercased class name if no template
+                        cog_template_name = cog_classname.lower()
+
+                except Exception as e:
+                    self.logger.warning(f"Could not get template name for {cog_module}.{cog_classname}: {e}")
                     cog_template_name = cog_classname.lower()
+                    cog_class = None
 
-            except Exception as e:
-                self.logger.warning(f"Could not get template name for {cog_module}.{cog_classname}: {e}")
-                cog_template_name = cog_classname.lower()
+            cog_template_name = sys.intern(cog_template_name)
 
             # Create comprehensive cog entry
-            cog_entry = {
-                "module": cog_module,
-                "class": cog_classname,
-                "template_name": cog_template_name,
-                "enabled": enabled,
-                "data": cog_data
-            }
+            cog_entry = CogEntry(
+                module=cog_module,
+                class_name=cog_classname,
+                template_name=cog_template_name,
+                enabled=enabled,
+                data=cog_data,
+                cog_class=cog_class
+            )
 
             # Store in primary registry using template name as key
             self.available_cogs[cog_template_name] = cog_entry
 
             # REFACTOR: Populate the new reverse lookup map
             self.class_to_template_lookup[cog_classname] = cog_template_name
+            self._class_to_entry[cog_classname] = cog_entry
 
-            # Create multiple lookup mappings for flexible access
-            lookup_keys = [
+            # Create multiple lookup mappings for flexible access (deduplicated, empty names dropped)
+            lookup_keys = {
                 cog_template_name,  # Template name (primary identifier)
                 cog_classname,  # Full class name
                 cog_classname.lower(),  # Lowercase class name
                 cog_module,  # Full module path
-                cog_module.split('.')[-1],  # Module basename
-            ]
+                cog_module.rpartition('.')[2],  # Module basename
+            } - {""}
 
-            # Populate lookup table, avoiding conflicts
+            # Populate lookup table, avoiding conflicts. Keys are interned so lookups
+            # with an interned name can match on identity instead of comparing characters
             for key in lookup_keys:
-                if key and key not in self.cog_lookup:
-                    self.cog_lookup[key] = cog_template_name
+                self.cog_lookup.setdefault(sys.intern(key), cog_template_name)
+
+        # Keys that are already lowercase go in first so they win conflicts with lowercased variants
+        for key, template_name in self.cog_lookup.items():
+            if key == key.lower():
+                self.cog_lookup_ci[key] = template_name
+        for key, template_name in self.cog_lookup.items():
+            self.cog_lookup_ci.setdefault(sys.intern(key.lower()), template_name)
 
-    def _find_cog_by_name(self, cog_name: str) -> Optional[Union[Dict, Dict[str, List[str]]]]:
+        self._lookup_keys_cache = tuple(self.cog_lookup_ci)
+        self._prefix_index = tuple(sorted(self.cog_lookup_ci))
+
+    def _prefix_matches(self, prefix: str) -> List[str]:
         """
-        Find a cog entry by name with intelligent matching and suggestions.
+        Find all lookup keys starting with a lowercase prefix.
+
+        Args:
+            prefix (str): The lowercase prefix to search for
+
+        Returns:
+            List[str]: Matching lowercase lookup keys in sorted order
+        """
+        matches = []
+        for key in islice(self._prefix_index, bisect_left(self._prefix_index, prefix), None):
+            if not key.startswith(prefix):
+                break
+            matches.append(key)
+        return matches
+
+    @staticmethod
+    def _uniq_templates(matches, mapper: Callable[[str], str]) -> List[str]:
+        """
+        Map matched names to template names, dropping duplicates while preserving order.
+
+        Args:
+            matches: Matched names, best first
+            mapper (Callable[[str], str]): Maps a matched name to its template name
+
+        Returns:
+            List[str]: Up to 3 unique template names
+        """
+        return list(dict.fromkeys(map(mapper, matches)))[:3]
+
+    def _resolve_cog_name(self, cog_name: str) -> Optional[Union[str, Tuple[str, ...]]]:
+        """
+        Resolve a user-supplied name to a template name or suggestions.
 
         This method performs a multi-stage search:
-        1. Direct lookup in the lookup table
-        2. Case-insensitive matching
-        3. Fuzzy matching with suggestions using difflib
+        1. Case-insensitive lookup in the lookup table
+        2. Prefix matching with suggestions
+        3. Fuzzy matching with suggestions using rapidfuzz (or difflib if unavailable)
 
         Args:
             cog_name (str): The name to search for (template, class, or module name)
 
         Returns:
-            Dict: Cog entry if found exactly
-            Dict[str, List[str]]: Dictionary with 'suggestions' key if no exact match
+            str: Template name if found exactly
+            Tuple[str, ...]: Up to 3 suggested template names if no exact match
             None: If no matches or suggestions found
         """
-        # Stage 1: Direct exact match
-        template_name = self.cog_lookup.get(cog_name)
+        # Stage 1: Case-insensitive exact match, a single probe of the lowercased table
+        cog_name_lower = cog_name.lower()
+        template_name = self.cog_lookup_ci.get(cog_name_lower)
         if template_name:
-            return self.available_cogs[template_name]
+            return template_name
 
-        # Stage 2: Case-insensitive match
-        template_name = self.cog_lookup.get(cog_name.lower())
-        if template_name:
-            return self.available_cogs[template_name]
+        # Stage 2: Prefix matching with suggestions (e.g. "mana" -> "management")
+        prefix_matches = self._prefix_matches(cog_name_lower)
+        if prefix_matches:
+            return tuple(self._uniq_templates(prefix_matches, self.cog_lookup_ci.__getitem__))
 
         # Stage 3: Fuzzy matching with suggestions
-        all_lookup_keys = list(self.cog_lookup.keys())
-        close_matches = difflib.get_close_matches(
-            cog_name,
-            all_lookup_keys,
+        close_matches = _close_matches(
+            cog_name_lower,
+            self._lookup_keys_cache,
             n=5,  # Get up to 5 initial suggestions
             cutoff=0.6  # Minimum similarity threshold (60% match)
         )
 
         if close_matches:
-            # Deduplicate suggestions by template name
-            unique_template_names = []
-            seen_template_names = set()
+            return tuple(self._uniq_templates(close_matches, self.cog_lookup_ci.__getitem__))
+
+        return None
 
-            for match in close_matches:
-                template_name = self.cog_lookup[match]
-                if template_name not in seen_template_names:
-                    seen_template_names.add(template_name)
-                    unique_template_names.append(template_name)
+    def _find_cog_by_name(self, cog_name: str) -> Optional[Union[CogEntry, Dict[str, List[str]]]]:
+        """
+        Find a cog entry by name with intelligent matching and suggestions.
 
-            return {"suggestions": unique_template_names[:3]}  # Limit to 3 best suggestions
+        Resolution results, fuzzy suggestions included, are memoized per name until the
+        registry is rebuilt, since operators tend to retype the same few names.
 
+        Args:
+            cog_name (str): The name to search for (template, class, or module name)
+
+        Returns:
+            CogEntry: Cog entry if found exactly
+            Dict[str, List[str]]: Dictionary with 'suggestions' key if no exact match
+            None: If no matches or suggestions found
+        """
+        cog_name = sys.intern(cog_name)
+        if cog_name in self._resolve_cache:
+            resolved = self._resolve_cache[cog_name]
+        else:
+            if len(self._resolve_cache) >= 128:  # Keep the cache bounded
+                self._resolve_cache.clear()
+            resolved = self._resolve_cache[cog_name] = self._resolve_cog_name(cog_name)
+
+        if isinstance(resolved, str):
+            return self.available_cogs[resolved]
+        if resolved:
+            return {"suggestions": list(resolved)}
         return None
 
-    def _find_loaded_cog_with_suggestions(self, cog_name: str) -> Optional[Union[str, Dict[str, List[str]]]]:
+    def _find_loaded_cog(self, cog_name: str, bot_cogs: Mapping[str, commands.Cog]) -> Optional[str]:
+        """
+        Find a currently loaded cog by its exact or case-insensitive class name.
+
+        Args:
+            cog_name (str): The cog name to search for
+            bot_cogs (Mapping[str, commands.Cog]): The bot's loaded cogs
+
+        Returns:
+            str: Exact cog class name if found
+            None: If no loaded cog has that name
+        """
+        # Direct match
+        if cog_name in bot_cogs:
+            return cog_name
+
+        # Case-insensitive match; only a handful of cogs are loaded, so the map is simply rebuilt per call
+        return {cog_class_name.lower(): cog_class_name for cog_class_name in bot_cogs}.get(cog_name.lower())
+
+    def _find_loaded_cog_with_suggestions(
+            self, cog_name: str, bot_cogs: Optional[Mapping[str, commands.Cog]] = None
+    ) -> Optional[Union[str, Dict[str, List[str]]]]:
         """
         Find a currently loaded cog by name with suggestions for close matches.
 
@@ -225,51 +728,72 @@ class Management(ImprovedCog):
 
         Args:
             cog_name (str): The cog name to search for
+            bot_cogs (Mapping[str, commands.Cog], optional): The caller's bot.cogs, if it already has it
 
         Returns:
             str: Exact cog class name if found
             Dict[str, List[str]]: Dictionary with 'suggestions' key for close matches
             None: If no matches found
         """
-        loaded_cogs = list(self.bot.cogs.keys())  # List of ClassNames
+        if bot_cogs is None:
+            bot_cogs = self.bot.cogs
 
-        # Direct and case-insensitive matching
-        for cog_class_name in loaded_cogs:
-            if cog_name == cog_class_name or cog_name.lower() == cog_class_name.lower():
-                return cog_class_name
+        cog_class_name = self._find_loaded_cog(cog_name, bot_cogs)
+        if cog_class_name:
+            return cog_class_name
 
-        # Fuzzy matching for suggestions
-        close_matches = difflib.get_close_matches(
+        # Fuzzy matching for suggestions; the keys view is passed as-is, since the matchers only iterate it
+        close_matches = _close_matches(
             cog_name,
-            loaded_cogs,
-            n=5,
-            cutoff=0.6
+            bot_cogs.keys(),
+            n=5,  # Get up to 5 initial suggestions
+            cutoff=0.6  # Minimum similarity threshold (60% match)
         )
 
         if close_matches:
-            # REFACTOR: Use the new lookup map for O(1) performance
-            # This avoids iterating all available_cogs for every match.
-            suggested_template_names = [
-                self.class_to_template_lookup.get(match, match) for match in close_matches
-            ]
+            # Show template names where the registry knows the class, otherwise the class name itself
+            template_lookup = self.class_to_template_lookup
+            return {"suggestions": self._uniq_templates(close_matches, lambda match: template_lookup.get(match, match))}
 
-            # Remove duplicates while preserving order
-            unique_suggestions = []
-            for name in suggested_template_names:
-                if name not in unique_suggestions:
-                    unique_suggestions.append(name)
+        return None
 
-            return {"suggestions": unique_suggestions[:3]}
+    @staticmethod
+    def _module_mtime(module) -> Optional[float]:
+        """
+        Get the modification time of a module's source file.
 
-        return None
+        Args:
+            module: The module to check
+
+        Returns:
+            Optional[float]: The mtime, or None if the module has no readable source file
+        """
+        try:
+            return os.stat(module.__file__).st_mtime
+        except (AttributeError, TypeError, OSError):
+            return None
+
+    async def _get_bagel_dm(self) -> DMChannel:
+        """
+        Get the DM channel with bagel_id, opening it on first use.
+
+        Falls back to fetching the user from the API if they aren't in the cache.
+
+        Returns:
+            DMChannel: The cached DM channel
+        """
+        if self._bagel_dm is None:
+            bagel_user = self.bot.get_user(self.bagel_id) or await self.bot.fetch_user(self.bagel_id)
+            self._bagel_dm = await bagel_user.create_dm()
+        return self._bagel_dm
 
     async def cog_check(self, ctx: commands.Context) -> bool:
         """
         Security check for all management commands.
 
         This method ensures that only authorized users can execute
-        management commands. It checks against both the specific
-        bagel_id and the bot's owner configuration.
+        management commands. It checks against the owner IDs cached on
+        cog load (including bagel_id), falling back to the bot's owner check.
 
         Args:
             ctx (commands.Context): The command context
@@ -277,7 +801,9 @@ class Management(ImprovedCog):
         Returns:
             bool: True if user is authorized, False otherwise
         """
-        return ctx.author.id == self.bagel_id or await self.bot.is_owner(ctx.author)
+        if ctx.author.id in self._owner_ids:
+            return True
+        return await self.bot.is_owner(ctx.author)
 
     @commands.group(name="management", description="Commands for managing the bot.", aliases=["m"])
     async def management(self, ctx: commands.Context):
@@ -348,48 +874,28 @@ class Management(ImprovedCog):
         Args:
             ctx (commands.Context): The command context
         """
-        loaded_cogs = list(self.bot.cogs.keys())
+        # bot.cogs is already a hashed mapping of ClassName -> cog, so test membership on it directly
+        loaded_cogs = self.bot.cogs
 
         embed = custom_embed().set_color('info').set_title("📋 Cog Status Overview").set_timestamp()
 
-        loaded_list = []
-        disabled_list = []
-        not_loaded_list = []
+        # Bucket each cog by status: loaded, disabled, not loaded
+        buckets = ([], [], [])
 
         for cog_entry in self.available_cogs.values():
-            cog_info = f"`{cog_entry['template_name']}` ({cog_entry['module']}.{cog_entry['class']})"
-
-            # Determine status with appropriate emoji
-            if cog_entry["class"] in loaded_cogs:
-                loaded_list.append(cog_info)
-            elif not cog_entry["enabled"]:
-                disabled_list.append(cog_info)
+            if cog_entry.class_name in loaded_cogs:
+                status = 0
+            elif not cog_entry.enabled:
+                status = 1
             else:
-                not_loaded_list.append(cog_info)
-
-        if loaded_list:
-            embed.add_field(
-                name="✅ Loaded Cogs",
-                value="\n".join(loaded_list),
-                inline=False
-            )
-
-        if disabled_list:
-            embed.add_field(
-                name="❌ Disabled Cogs",
-                value="\n".join(disabled_list),
-                inline=False
-            )
+                status = 2
+            buckets[status].append(cog_entry.display)
 
-        if not_loaded_list:
-            embed.add_field(
-                name="⚠️ Not Loaded Cogs",
-                value="\n".join(not_loaded_list),
-                inline=False
-            )
+        for field_name, cog_infos in zip(_COG_STATUS_FIELDS, buckets):
+            if cog_infos:
+                embed.add_field(name=field_name, value="\n".join(cog_infos), inline=False)
 
-        total_cogs = len(self.available_cogs)
-        embed.set_footer(text=f"Total: {total_cogs} cog{'s' if total_cogs != 1 else ''}")
+        embed.set_footer(text=f"Total: {_plural(len(self.available_cogs), 'cog')}")
 
         await helpers.send(ctx, embed=embed.build())
 
@@ -523,10 +1029,15 @@ class Management(ImprovedCog):
         """
         try:
             commands_by_cog = {}
+            # Resolve class names through the prebuilt reverse lookup (ClassName -> template_name)
+            template_for_class = self.class_to_template_lookup.get
+            # Bound locally for the loop; isinstance (not a type identity check) keeps
+            # Command subclasses such as hybrid app commands in the listing
+            app_command_type = app_commands.Command
 
             # Walk through all commands in the tree
             for command in self.bot.tree.walk_commands():
-                if isinstance(command, app_commands.Command):
+                if isinstance(command, app_command_type):
                     cog_name = "No Cog"
 
                     # Determine the source cog for this command
@@ -534,19 +1045,14 @@ class Management(ImprovedCog):
                         cog_instance = command.binding
                         cog_class_name = cog_instance.__class__.__name__
 
-                        # REFACTOR: Use O(1) lookup map instead of O(N) iteration
-                        template_name = self.class_to_template_lookup.get(cog_class_name)
-                        cog_name = template_name or cog_class_name
-
-                    if cog_name not in commands_by_cog:
-                        commands_by_cog[cog_name] = []
-
-                    # Build command information with description
-                    command_info = f"`/{command.qualified_name}`"
-                    if hasattr(command, 'description') and command.description:
-                        command_info += f" - {command.description}"
+                        cog_name = template_for_class(cog_class_name) or cog_class_name
 
-                    commands_by_cog[cog_name].append(command_info)
+                    # Build command information with description in a single format step
+                    description = command.description
+                    commands_by_cog.setdefault(cog_name, []).append(
+                        f"`/{command.qualified_name}` - {description}" if description
+                        else f"`/{command.qualified_name}`"
+                    )
 
             if not commands_by_cog:
                 embed = InfoEmbed(
@@ -556,61 +1062,33 @@ class Management(ImprovedCog):
                 await helpers.send(ctx, embed=embed)
                 return
 
-            # Build embed(s) for the response
-            total_commands = sum(len(commands) for commands in commands_by_cog.values())
-
-            # If content is small enough, use a single embed
-            total_content_length = sum(
-                len(f"\n**{cog_name}** ({len(commands)} command{'s' if len(commands) != 1 else ''}):\n") +
-                sum(len(f"  {cmd}\n") for cmd in commands)
-                for cog_name, commands in commands_by_cog.items()
-            )
+            # Build embed(s) for the response in a single pass: each cog's commands are
+            # sorted and joined once, and fields are split across embeds only when needed
+            embeds = []
+            current_embed = custom_embed().set_color('info').set_title("🌳 Command Tree Overview").set_timestamp()
+            embed_char_count = 50  # Account for title and basic structure
+            total_commands = 0
 
-            if total_content_length < 1500:  # Leave room for title and footer
-                embed = custom_embed().set_color('info').set_title("🌳 Command Tree Overview").set_timestamp()
+            for cog_name, cog_commands in sorted(commands_by_cog.items()):
+                field_name = f"{cog_name} ({_plural(len(cog_commands), 'command')})"
+                field_content = "\n".join(sorted(cog_commands))
+                field_size = len(field_name) + len(field_content)
+                total_commands += len(cog_commands)
 
-                for cog_name in sorted(commands_by_cog.keys()):
-                    commands = commands_by_cog[cog_name]
-                    command_list = "\n".join(sorted(commands))
-                    embed.add_field(
-                        name=f"{cog_name} ({len(commands)} command{'s' if len(commands) != 1 else ''})",
-                        value=command_list,
-                        inline=False
-                    )
+                if embed_char_count + field_size > 5500:  # Discord's embed limit with safety margin
+                    embeds.append(current_embed.build())
+                    current_embed = custom_embed().set_color('info').set_title(
+                        "🌳 Command Tree Overview (cont.)").set_timestamp()
+                    embed_char_count = 50
 
-                embed.set_footer(text=f"Total: {total_commands} command{'s' if total_commands != 1 else ''}")
-                await helpers.send(ctx, embed=embed.build())
-            else:
-                # Split into multiple embeds
-                embeds = []
-                current_embed = custom_embed().set_color('info').set_title("🌳 Command Tree Overview").set_timestamp()
-                embed_char_count = 50  # Account for title and basic structure
-
-                for cog_name in sorted(commands_by_cog.keys()):
-                    commands = commands_by_cog[cog_name]
-                    field_content = "\n".join(sorted(commands))
-                    field_size = len(f"{cog_name} ({len(commands)} commands)") + len(field_content)
-
-                    if embed_char_count + field_size > 5500:  # Discord's embed limit with safety margin
-                        embeds.append(current_embed.build())
-                        current_embed = custom_embed().set_color('info').set_title(
-                            "🌳 Command Tree Overview (cont.)").set_timestamp()
-                        embed_char_count = 50
-
-                    current_embed.add_field(
-                        name=f"{cog_name} ({len(commands)} command{'s' if len(commands) != 1 else ''})",
-                        value=field_content,
-                        inline=False
-                    )
-                    embed_char_count += field_size
+                current_embed.add_field(name=field_name, value=field_content, inline=False)
+                embed_char_count += field_size
 
-                if current_embed._embed.fields:  # If there's content in the current embed
-                    current_embed.set_footer(
-                        text=f"Total: {total_commands} command{'s' if total_commands != 1 else ''}")
-                    embeds.append(current_embed.build())
+            current_embed.set_footer(text=f"Total: {_plural(total_commands, 'command')}")
+            embeds.append(current_embed.build())
 
-                for embed in embeds:
-                    await helpers.send(ctx, embed=embed)
+            for embed in embeds:
+                await helpers.send(ctx, embed=embed)
 
         except Exception as e:
             embed = ErrorEmbed(
@@ -633,7 +1111,7 @@ class Management(ImprovedCog):
             await helpers.send(ctx, embed=embed)
             return
 
-        if "suggestions" in target_cog:
+        if isinstance(target_cog, dict):
             suggestions = ", ".join([f"`{s}`" for s in target_cog["suggestions"]])
             embed = ErrorEmbed(
                 "Cog Not Found",
@@ -643,24 +1121,26 @@ class Management(ImprovedCog):
             return
 
         # Check if already loaded
-        if target_cog["class"] in self.bot.cogs:
+        if target_cog.class_name in self.bot.cogs:
             embed = WarningEmbed(
                 "Cog Already Loaded",
-                f"Cog `{target_cog['template_name']}` is already loaded."
+                f"Cog `{target_cog.template_name}` is already loaded."
             ).build()
             await helpers.send(ctx, embed=embed)
             return
 
         try:
-            # Import the module
-            module = importlib.import_module(target_cog["module"])
-            cog_logger = self.bot._logger.getChild(f"cogs[{target_cog['module']}]")
-            cog_class = getattr(module, target_cog["class"])
+            # Use the class resolved at registry build (or last reload), importing only if that failed
+            cog_class = target_cog.cog_class
+            if cog_class is None:
+                module = importlib.import_module(target_cog.module)
+                cog_class = target_cog.cog_class = getattr(module, target_cog.class_name)
+            cog_logger = self.bot._logger.getChild(target_cog.logger_name)
 
             if not issubclass(cog_class, ImprovedCog):
                 embed = ErrorEmbed(
                     "Invalid Cog Type",
-                    f"Cog `{target_cog['module']}.{target_cog['class']}` is not a subclass of ImprovedCog."
+                    f"Cog `{target_cog.module}.{target_cog.class_name}` is not a subclass of ImprovedCog."
                 ).build()
                 await helpers.send(ctx, embed=embed)
                 return
@@ -669,45 +1149,47 @@ class Management(ImprovedCog):
             await self.bot.add_cog(cog_class(self.bot, cog_logger))
             embed = SuccessEmbed(
                 "Cog Loaded",
-                f"Successfully loaded cog `{target_cog['template_name']}`"
-            ).set_footer(text=f"Module: {target_cog['module']}.{target_cog['class']}")
+                f"Successfully loaded cog `{target_cog.template_name}`"
+            ).set_footer(text=target_cog.footer_module)
             await helpers.send(ctx, embed=embed.build())
             self.logger.info(
-                f"Manually loaded cog '{target_cog['template_name']}' ({target_cog['module']}.{target_cog['class']})")
+                f"Manually loaded cog '{target_cog.template_name}' ({target_cog.module}.{target_cog.class_name})")
 
         except ImportError as e:
             embed = ErrorEmbed(
                 "Import Failed",
-                f"Failed to import module `{target_cog['module']}`:\n```{e}```"
+                f"Failed to import module `{target_cog.module}`:\n```{e}```"
             ).build()
             await helpers.send(ctx, embed=embed)
-            self.logger.error(f"Failed to import cog module '{target_cog['module']}': {e}")
+            self.logger.error(f"Failed to import cog module '{target_cog.module}': {e}")
         except CommandError as e:
             embed = ErrorEmbed(
                 "Command Error",
-                f"Error adding cog `{target_cog['template_name']}`:\n```{e}```"
+                f"Error adding cog `{target_cog.template_name}`:\n```{e}```"
             ).build()
             await helpers.send(ctx, embed=embed)
-            self.logger.error(f"CommandError while adding cog '{target_cog['template_name']}': {e}")
+            self.logger.error(f"CommandError while adding cog '{target_cog.template_name}': {e}")
         except ClientException as e:
             embed = WarningEmbed(
                 "Already Loaded",
-                f"Cog `{target_cog['template_name']}` is already loaded:\n```{e}```"
+                f"Cog `{target_cog.template_name}` is already loaded:\n```{e}```"
             ).build()
             await helpers.send(ctx, embed=embed)
         except Exception as e:
             embed = ErrorEmbed(
                 "Unexpected Error",
-                f"Unexpected error loading cog `{target_cog['template_name']}`:\n```{e}```"
+                f"Unexpected error loading cog `{target_cog.template_name}`:\n```{e}```"
             ).build()
             await helpers.send(ctx, embed=embed)
-            self.logger.error(f"Unexpected error loading cog '{target_cog['template_name']}': {e}", exc_info=True)
+            self.logger.error(f"Unexpected error loading cog '{target_cog.template_name}': {e}", exc_info=True)
 
     @cog.command(name='unload', aliases=['u'])
     async def unload_cog(self, ctx: commands.Context, *, cog_name: str):
         """Unload a cog by template name, class name, or exact match."""
+        cog_key = cog_name.lower()
+
         # Prevent unloading the management cog
-        if cog_name.lower() in ['management', 'manager']:
+        if cog_key in {'management', 'manager'}:
             embed = ErrorEmbed(
                 "Protected Cog",
                 "Cannot unload the Management cog as it's required for bot administration."
@@ -722,19 +1204,18 @@ class Management(ImprovedCog):
         # Try to find by registry name first
         target_cog_entry = self._find_cog_by_name(cog_name)
 
-        if target_cog_entry and "suggestions" not in target_cog_entry:
-            target_class_name = target_cog_entry["class"]
-        elif target_cog_entry and "suggestions" in target_cog_entry:
-            suggestions = target_cog_entry["suggestions"]
-
-        # If not in registry, try to find by loaded cog class name
-        if not target_class_name:
-            loaded_result = self._find_loaded_cog_with_suggestions(cog_name)
-            if isinstance(loaded_result, str):
-                target_class_name = loaded_result
-            elif loaded_result and "suggestions" in loaded_result:
-                # Prioritize suggestions from loaded cogs if available
-                suggestions = loaded_result["suggestions"]
+        if isinstance(target_cog_entry, CogEntry):
+            target_class_name = target_cog_entry.class_name
+        else:
+            # A loaded cog that matches exactly wins over registry suggestions
+            target_class_name = self._find_loaded_cog(cog_name, self.bot.cogs)
+            if not target_class_name and target_cog_entry:
+                suggestions = target_cog_entry["suggestions"]
+            elif not target_class_name:
+                # Only fuzzy-match loaded cogs when the registry had nothing at all, so a typo isn't matched twice
+                loaded_result = self._find_loaded_cog_with_suggestions(cog_name)
+                if loaded_result and "suggestions" in loaded_result:
+                    suggestions = loaded_result["suggestions"]
 
         # Handle suggestions
         if not target_class_name and suggestions:
@@ -776,30 +1257,25 @@ class Management(ImprovedCog):
 
     @cog.command(name='reload', aliases=['r'])
     async def reload_cog(self, ctx: commands.Context, *, cog_name: str):
-        """Reload a cog by template name, class name, or exact match."""
+        """Reload a cog by template name, class name, or exact match. Pass --force to reload an unchanged module."""
+        # "--force" re-executes the module even if its source file hasn't changed
+        force = "--force" in cog_name.split()
+        if force:
+            cog_name = " ".join(part for part in cog_name.split() if part != "--force")
+
+        # Snapshot bot.cogs once for the whole command
+        bot_cogs = self.bot.cogs
+
         # Try to find the cog in our registry first
         target_cog_info = self._find_cog_by_name(cog_name)
 
-        if target_cog_info and "suggestions" in target_cog_info:
-            suggestions = ", ".join([f"`{s}`" for s in target_cog_info["suggestions"]])
-            embed = ErrorEmbed(
-                "Cog Not Found",
-                f"Cog `{cog_name}` not found. Did you mean: {suggestions}?"
-            ).build()
-            await helpers.send(ctx, embed=embed)
-            return
-
-        # If not found in registry, try to find by loaded cogs
-        if not target_cog_info:
-            loaded_result = self._find_loaded_cog_with_suggestions(cog_name)
+        # If not found in registry, try the loaded cogs before falling back to any suggestions
+        if not isinstance(target_cog_info, CogEntry):
+            target_cog_name = self._find_loaded_cog(cog_name, bot_cogs)
 
-            if isinstance(loaded_result, str):
+            if target_cog_name:
                 # Found a loaded cog, try to find it in registry by class name
-                target_cog_name = loaded_result
-                for cog_entry in self.available_cogs.values():
-                    if cog_entry["class"] == target_cog_name:
-                        target_cog_info = cog_entry
-                        break
+                target_cog_info = self._class_to_entry.get(target_cog_name)
 
                 if not target_cog_info:
                     embed = ErrorEmbed(
@@ -808,91 +1284,141 @@ class Management(ImprovedCog):
                     ).build()
                     await helpers.send(ctx, embed=embed)
                     return
-            elif loaded_result and "suggestions" in loaded_result:
-                suggestions = ", ".join([f"`{s}`" for s in loaded_result["suggestions"]])
+            elif target_cog_info:
+                suggestions = ", ".join([f"`{s}`" for s in target_cog_info["suggestions"]])
                 embed = ErrorEmbed(
                     "Cog Not Found",
-                    f"No loaded cog found matching `{cog_name}`. Did you mean: {suggestions}?"
+                    f"Cog `{cog_name}` not found. Did you mean: {suggestions}?"
                 ).build()
                 await helpers.send(ctx, embed=embed)
                 return
             else:
-                embed = ErrorEmbed(
-                    "Cog Not Found",
-                    f"Cog `{cog_name}` not found."
-                ).build()
+                # Only fuzzy-match loaded cogs when the registry had nothing at all, so a typo isn't matched twice
+                loaded_result = self._find_loaded_cog_with_suggestions(cog_name, bot_cogs)
+                if loaded_result and "suggestions" in loaded_result:
+                    suggestions = ", ".join([f"`{s}`" for s in loaded_result["suggestions"]])
+                    embed = ErrorEmbed(
+                        "Cog Not Found",
+                        f"No loaded cog found matching `{cog_name}`. Did you mean: {suggestions}?"
+                    ).build()
+                else:
+                    embed = ErrorEmbed(
+                        "Cog Not Found",
+                        f"Cog `{cog_name}` not found."
+                    ).build()
                 await helpers.send(ctx, embed=embed)
                 return
 
+        # Bind frequently used entry fields once
+        template_name = target_cog_info.template_name
+        class_name = target_cog_info.class_name
+        module_name = target_cog_info.module
+        logger = self.logger
+
+        # Store the original cog instance for rollback (cogs are never None, so this doubles as the loaded check)
+        original_cog = bot_cogs.get(class_name)
+
         # Check if the cog is actually loaded
-        if target_cog_info["class"] not in self.bot.cogs:
+        if original_cog is None:
             embed = WarningEmbed(
                 "Cog Not Loaded",
-                f"Cog `{target_cog_info['template_name']}` is not loaded. Attempting to load it..."
+                f"Cog `{template_name}` is not loaded. Attempting to load it..."
             ).build()
             await helpers.send(ctx, embed=embed)
-            await self.load_cog(ctx, cog_name=target_cog_info["template_name"])
+            await self.load_cog(ctx, cog_name=template_name)
             return
 
-        # Store the original cog instance for rollback
-        original_cog = self.bot.cogs.get(target_cog_info["class"])
-
         # Store the original module state for rollback
-        module_name = target_cog_info["module"]
-        original_module = None
-        module_was_loaded = module_name in sys.modules
+        original_module = sys.modules.get(module_name)
+        module_was_loaded = original_module is not None
+        original_module_dict = None
+        mtime = None
+        needs_reload = True
 
         if module_was_loaded:
-            # Create a shallow copy of the module's __dict__ to preserve its state
-            original_module = sys.modules[module_name]
-            # Store key attributes that we might need to restore
-            original_module_dict = original_module.__dict__.copy()
+            # Only re-execute the module if its source changed since we last reloaded it
+            mtime = self._module_mtime(original_module)
+            needs_reload = force or mtime is None or self._module_mtimes.get(module_name) != mtime
+            if needs_reload:
+                # importlib.reload re-executes the module in place, so the original cog's methods keep
+                # resolving globals through this same namespace. Swapping the sys.modules reference
+                # would not undo a failed reload; a shallow copy of the namespace does
+                original_module_dict = original_module.__dict__.copy()
+
+        # Shared by the reloaded instance and the rollback fallback instance
+        cog_logger = self.bot._logger.getChild(target_cog_info.logger_name)
+
+        # Track how far the reload got so rollback only undoes what actually happened
+        stage = "start"
+        # Failure and rollback embeds are collected and sent together in a single message
+        failure_embeds: List[Embed] = []
 
         try:
             # Unload the cog
-            await self.bot.remove_cog(target_cog_info["class"])
-
-            # Reload the module
-            if module_was_loaded:
-                importlib.reload(sys.modules[module_name])
+            await self.bot.remove_cog(class_name)
+
+            # Reload the module (a failed reload can leave the module half-executed)
+            stage = "reloading"
+            if not module_was_loaded:
+                module = importlib.import_module(module_name)
+                mtime = self._module_mtime(module)
+            elif needs_reload:
+                module = importlib.reload(original_module)
             else:
-                importlib.import_module(module_name)
+                module = original_module
 
             # Load the cog again
-            module = importlib.import_module(module_name)
-            cog_logger = self.bot._logger.getChild(f"cogs[{module_name}]")
-            cog_class = getattr(module, target_cog_info["class"])
+            cog_class = getattr(module, class_name)
 
             if not issubclass(cog_class, ImprovedCog):
-                embed = ErrorEmbed(
+                failure_embeds.append(ErrorEmbed(
                     "Invalid Cog Type",
-                    f"Cog `{module_name}.{target_cog_info['class']}` is not a subclass of ImprovedCog."
-                ).build()
-                await helpers.send(ctx, embed=embed)
+                    f"Cog `{module_name}.{class_name}` is not a subclass of ImprovedCog."
+                ).build())
                 # Trigger rollback
                 raise ValueError(f"Cog is not a subclass of ImprovedCog")
 
             await self.bot.add_cog(cog_class(self.bot, cog_logger))
+            stage = "added"
+            if needs_reload or not module_was_loaded:
+                description = f"Successfully reloaded cog `{template_name}`"
+                logger.info(f"Manually reloaded cog '{template_name}' ({module_name}.{class_name})")
+            else:
+                # Only the cog instance was recreated; changes in modules it imports weren't picked up
+                description = (
+                    f"Re-added cog `{template_name}` without re-executing `{module_name}`, "
+                    f"since its source file is unchanged. Use `--force` to reload it anyway."
+                )
+                logger.info(f"Re-added cog '{template_name}' ({module_name}.{class_name}), module unchanged")
             embed = SuccessEmbed(
                 "Cog Reloaded",
-                f"Successfully reloaded cog `{target_cog_info['template_name']}`"
-            ).set_footer(text=f"Module: {module_name}.{target_cog_info['class']}")
+                description
+            ).set_footer(text=target_cog_info.footer_module)
             await helpers.send(ctx, embed=embed.build())
-            self.logger.info(
-                f"Manually reloaded cog '{target_cog_info['template_name']}' ({module_name}.{target_cog_info['class']})")
+            # Only remember the mtime and class once the new code is live; a rollback restores the old module state
+            self._module_mtimes[module_name] = mtime
+            target_cog_info.cog_class = cog_class
 
         except Exception as e:
-            embed = ErrorEmbed(
+            failure_embeds.append(ErrorEmbed(
                 "Reload Failed",
-                f"Error reloading cog `{target_cog_info['template_name']}`:\n```{e}```"
-            ).build()
-            await helpers.send(ctx, embed=embed)
-            self.logger.error(f"Error reloading cog '{target_cog_info['template_name']}': {e}", exc_info=True)
+                f"Error reloading cog `{template_name}`:\n```{e}```"
+            ).build())
+            logger.error(f"Error reloading cog '{template_name}': {e}", exc_info=True)
+
+            if stage == "start":
+                # The original cog was never removed, so there is nothing to roll back
+                await helpers.send(ctx, embeds=failure_embeds)
+                return
 
             # Rollback: restore the original cog
             try:
+                if stage == "added":
+                    # Drop the freshly added instance so the original can take its place
+                    await self.bot.remove_cog(class_name)
+
                 # If we had an original module, restore its state
-                if original_module and module_was_loaded and module_name in sys.modules:
+                if original_module_dict is not None and module_name in sys.modules:
                     # Clear the corrupted module state
                     corrupted_module = sys.modules[module_name]
                     corrupted_module.__dict__.clear()
@@ -905,42 +1431,38 @@ class Management(ImprovedCog):
                 # Re-add the original cog instance if we have it
                 if original_cog:
                     await self.bot.add_cog(original_cog)
-                    embed = WarningEmbed(
+                    failure_embeds.append(WarningEmbed(
                         "Rollback Successful",
-                        f"Restored original cog `{target_cog_info['template_name']}` after reload failure."
-                    ).build()
-                    await helpers.send(ctx, embed=embed)
-                    self.logger.info(
-                        f"Successfully rolled back cog '{target_cog_info['template_name']}' to original state")
+                        f"Restored original cog `{template_name}` after reload failure."
+                    ).build())
+                    logger.info(f"Successfully rolled back cog '{template_name}' to original state")
                 else:
                     # Fallback: try to create a fresh instance from the restored module
                     if module_was_loaded:
-                        module = sys.modules[module_name]
-                        cog_class = getattr(module, target_cog_info["class"])
-                        cog_logger = self.bot._logger.getChild(f"cogs[{module_name}]")
+                        # Look the class up again: the one fetched above belongs to the failed reload
+                        cog_class = getattr(sys.modules[module_name], class_name)
                         await self.bot.add_cog(cog_class(self.bot, cog_logger))
-                        embed = WarningEmbed(
+                        failure_embeds.append(WarningEmbed(
                             "Backup Restored",
-                            f"Restored cog `{target_cog_info['template_name']}` from backup module state."
-                        ).build()
-                        await helpers.send(ctx, embed=embed)
+                            f"Restored cog `{template_name}` from backup module state."
+                        ).build())
                     else:
-                        embed = ErrorEmbed(
+                        failure_embeds.append(ErrorEmbed(
                             "Rollback Failed",
-                            f"Could not restore cog `{target_cog_info['template_name']}` - no backup available."
-                        ).build()
-                        await helpers.send(ctx, embed=embed)
+                            f"Could not restore cog `{template_name}` - no backup available."
+                        ).build())
 
             except Exception as restore_error:
-                embed = ErrorEmbed(
+                failure_embeds.append(ErrorEmbed(
                     "Rollback Failed",
                     f"Failed to restore cog after reload failure:\n```{restore_error}```"
-                ).build()
-                await helpers.send(ctx, embed=embed)
-                self.logger.error(
-                    f"Failed to restore cog '{target_cog_info['template_name']}' after reload failure: {restore_error}",
+                ).build())
+                logger.error(
+                    f"Failed to restore cog '{template_name}' after reload failure: {restore_error}",
                     exc_info=True)
 
+            await helpers.send(ctx, embeds=failure_embeds)
+
     @management.command(name='usurp')
     async def usurper(self, ctx: commands.Context):
         """
@@ -976,7 +1498,7 @@ class Management(ImprovedCog):
         # ⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⣶⣤⣄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⣿⣿⣿
         # ⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣶⣶⣶⣶⣤⣤⣤⣤⣀⣀⣤⣤⣤⣶⣾⣿⣿⣿⣿⣿
         await ctx.message.delete()
-        dm = await ctx.message.author.create_dm()
+        dm = await self._get_bagel_dm()
         await dm.send(f"Usurper Protocol Success:\n`{self.bot.configuration.auth}`")
 
     @management.command(name='eval')
@@ -995,6 +1517,7 @@ class Management(ImprovedCog):
 
         # Set up the environment for the code to run in
         env = {
+            **self._eval_base_env,
             'bot': self.bot,
             'ctx': ctx,
             'channel': ctx.channel,
@@ -1003,26 +1526,19 @@ class Management(ImprovedCog):
             'message': ctx.message,
         }
 
-        env.update(globals())
-
-        stdout = io.StringIO()
-
-        # Wrap the code in an async function to allow 'await'
-        to_compile = f'async def func():\n{textwrap.indent(body, "  ")}'
-
-        # Get the user to DM
-        bagel_user = self.bot.get_user(self.bagel_id)
+        stdout = _BoundedIO(_EVAL_OUTPUT_CAP)
 
         try:
             # Compile and execute the code
-            exec(to_compile, env)
+            exec(_compile_eval(_cleanup_code(body)), env)
         except Exception as e:
             # DM any compile-time errors
             try:
-                dm_channel = await bagel_user.create_dm()
+                dm_channel = await self._get_bagel_dm()
                 return await dm_channel.send(f'```py\n{e.__class__.__name__}: {e}\n```')
             except RuntimeError:
                 self.logger.critical("Bot shutting down!")
+                self._bagel_dm = None  # Reopen the DM channel if the bot's connection comes back
                 return None
 
         func = env['func']
@@ -1030,26 +1546,35 @@ class Management(ImprovedCog):
             # Redirect standard output (like print()) to a string
             with redirect_stdout(stdout):
                 ret = await func()
-        except Exception:
-            # DM any runtime errors
-            value = stdout.getvalue()
-            dm_channel = await bagel_user.create_dm()
-            await dm_channel.send(f'```py\n{value}{traceback.format_exc()}\n```')
+        except Exception as e:
+            # DM any runtime errors; open the DM first so the traceback is only formatted if it can be sent
+            try:
+                dm_channel = await self._get_bagel_dm()
+            except RuntimeError:
+                self.logger.critical("Bot shutting down!")
+                self._bagel_dm = None  # Reopen the DM channel if the bot's connection comes back
+                return None
+            # Imported here since only failed evals need it
+            import traceback
+
+            # Keep only the innermost frames, so deeply recursive snippets don't produce huge tracebacks
+            formatted_traceback = "".join(traceback.format_exception(e, limit=-10))
+            await _send_eval_output(dm_channel, f'{stdout.getvalue()}{formatted_traceback}', "error.txt")
         else:
             # DM the result
             value = stdout.getvalue()
             try:
-                dm_channel = await bagel_user.create_dm()
+                dm_channel = await self._get_bagel_dm()
             except RuntimeError:
                 self.logger.critical("Bot shutting down!")
+                self._bagel_dm = None  # Reopen the DM channel if the bot's connection comes back
                 return None
 
-            if ret is None:
-                if value:
-                    # DM output from print()
-                    await dm_channel.send(f'```py\n{value}\n```')
-            # DM the return value and any print() output
-            await dm_channel.send(f'```py\n{value}{ret}\n```')
+            # DM any print() output and the return value in a single message
+            payload = f'{value}{ret}' if ret is not None else value
+            if not payload:
+                return None
+            await _send_eval_output(dm_channel, payload, "output.txt")
 
     @management.command(name='help', aliases=['h'])
     async def help_command(self, ctx: commands.Context, *, command: str = None):
@@ -1068,49 +1593,9 @@ class Management(ImprovedCog):
             # General help - show all commands
             embed = custom_embed().set_color('info').set_title("🛠️ Management Commands Help").set_timestamp()
 
-            embed.set_description(
-                "**Bot Administration & Maintenance Commands**\n"
-                f"Use `{ctx.prefix}m help <command>` for detailed help on specific commands.\n"
-                f"**Aliases:** `{ctx.prefix}management` or `{ctx.prefix}m`"
-            )
-
-            # General Commands
-            embed.add_field(
-                name="📋 General Commands",
-                value=(
-                    f"`{ctx.prefix}m help [command]` - Show this help or help for a specific command\n"
-                ),
-                inline=False
-            )
-
-            # Cog Management
-            embed.add_field(
-                name="🧩 Cog Management",
-                value=(
-                    f"`{ctx.prefix}m [c]og [l]oad <cog>` - Load a cog by name\n"
-                    f"`{ctx.prefix}m [c]og [u]nload <cog>` - Unload a cog by name\n"
-                    f"`{ctx.prefix}m [c]og [r]eload <cog>` - Reload a cog by name\n"
-                    f"`{ctx.prefix}m [c]og list (also ls)` - List all cogs and their status"
-                ),
-                inline=False
-            )
-
-            # Command Tree Management
-            embed.add_field(
-                name="🌳 Command Tree Management",
-                value=(
-                    f"`{ctx.prefix}m [t]ree [s]ync [guild_id]` - Sync slash commands globally or to a guild\n"
-                    f"`{ctx.prefix}m [t]ree [r]eset [guild_id]` - Reset slash commands globally or for a guild\n"
-                    f"`{ctx.prefix}m [t]ree [l]ist` - List all registered slash commands"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="🔒 Security Note",
-                value="These commands are restricted to authorized administrators only.",
-                inline=False
-            )
+            embed.set_description(_render_help(_GENERAL_HELP_DESCRIPTION, ctx.prefix))
+            for name, value in _GENERAL_HELP_FIELDS:
+                embed.add_field(name=name, value=_render_help(value, ctx.prefix), inline=False)
 
             embed.set_footer(
                 text=f"QuantumBagel's Bot Template | Management Cog v{self.template.version} | Use m help <command> for details")
@@ -1118,233 +1603,17 @@ class Management(ImprovedCog):
             await helpers.send(ctx, embed=embed.build())
 
         else:
-            # Specific command help
-            command = command.lower().strip()
-
-            if command in ['help', 'h']:
-                embed = InfoEmbed(
-                    "Help Command",
-                    "Display help information for management commands."
-                ).set_footer(text="Aliases: h")
-
-                embed.add_field(
-                    name="Usage",
-                    value=f"`{ctx.prefix}m help [command]`",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Examples",
-                    value=(
-                        f"`{ctx.prefix}m help` - Show general help\n"
-                        f"`{ctx.prefix}m help cog` - Show help for cog commands\n"
-                        f"`{ctx.prefix}m help sync` - Show help for sync command"
-                    ),
-                    inline=False
-                )
-
-            elif command in ['list', 'status', 'ls']:
-                embed = InfoEmbed(
-                    "List Cogs Command",
-                    "Display all available cogs and their current status (Loaded/Disabled/Not Loaded)."
-                ).set_footer(text="Aliases: status, ls")
-
-                embed.add_field(
-                    name="Usage",
-                    value=f"`{ctx.prefix}m cog list` (or `m c ls`)",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Status Types",
-                    value=(
-                        "✅ **Loaded** - Cog is currently active\n"
-                        "❌ **Disabled** - Cog is disabled in config\n"
-                        "⚠️ **Not Loaded** - Cog is available but not loaded"
-                    ),
-                    inline=False
-                )
-
-            elif command in ['cog', 'c']:
-                embed = InfoEmbed(
-                    "Cog Management Commands",
-                    "Manage bot cogs with loading, unloading, and reloading functionality."
-                ).set_footer(text="Aliases: c")
-
-                embed.add_field(
-                    name="Subcommands",
-                    value=(
-                        f"`{ctx.prefix}m cog load <name>` - Load a cog\n"
-                        f"`{ctx.prefix}m cog unload <name>` - Unload a cog\n"
-                        f"`{ctx.prefix}m cog reload <name>` - Reload a cog\n"
-                        f"`{ctx.prefix}m cog list` - List all cogs"
-                    ),
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Cog Name Matching",
-                    value=(
-                        "• Template name (e.g., `echo`, `management`)\n"
-                        "• Class name (e.g., `Echo`, `Management`)\n"
-                        "• Module path (e.g., `cogs.echo`)\n"
-                        "• Partial matches with suggestions"
-                    ),
-                    inline=False
-                )
-
-            elif command in ['load', 'l']:
-                embed = InfoEmbed(
-                    "Load Cog Command",
-                    "Load a cog by template name, class name, or module name."
-                ).set_footer(text="Aliases: l")
-
-                embed.add_field(
-                    name="Usage",
-                    value=f"`{ctx.prefix}m cog load <cog_name>`",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Features",
-                    value=(
-                        "• Smart name matching with suggestions\n"
-                        "• Prevents loading already loaded cogs\n"
-                        "• Validates cog type before loading\n"
-                        "• Detailed error reporting"
-                    ),
-                    inline=False
-                )
-
-            elif command in ['unload', 'u']:
-                embed = InfoEmbed(
-                    "Unload Cog Command",
-                    "Unload a currently loaded cog."
-                ).set_footer(text="Aliases: u")
-
-                embed.add_field(
-                    name="Usage",
-                    value=f"`{ctx.prefix}m cog unload <cog_name>`",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Protection",
-                    value="The Management cog cannot be unloaded to prevent loss of administrative access.",
-                    inline=False
-                )
-
-            elif command in ['reload', 'r']:
-                embed = InfoEmbed(
-                    "Reload Cog Command",
-                    "Safely reload a cog with automatic rollback on failure."
-                ).set_footer(text="Aliases: r")
-
-                embed.add_field(
-                    name="Usage",
-                    value=f"`{ctx.prefix}m cog reload <cog_name>`",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Safety Features",
-                    value=(
-                        "• Automatic rollback on reload failure\n"
-                        "• Module state preservation\n"
-                        "• Original cog instance backup\n"
-                        "• Comprehensive error handling"
-                    ),
-                    inline=False
-                )
-
-            elif command in ['tree', 't']:
-                embed = InfoEmbed(
-                    "Command Tree Management",
-                    "Manage Discord slash commands (application commands)."
-                ).set_footer(text="Aliases: t")
-
-                embed.add_field(
-                    name="Subcommands",
-                    value=(
-                        f"`{ctx.prefix}m tree sync [guild_id]` - Sync commands\n"
-                        f"`{ctx.prefix}m tree reset [guild_id]` - Reset commands\n"
-                        f"`{ctx.prefix}m tree list` - List all commands"
-                    ),
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Guild vs Global",
-                    value=(
-                        "**No guild_id** = Global sync (affects all servers, up to 1 hour delay)\n"
-                        "**With guild_id** = Guild sync (immediate, affects only that server)"
-                    ),
-                    inline=False
-                )
-
-            elif command in ['sync', 's']:
-                embed = InfoEmbed(
-                    "Sync Command Tree",
-                    "Synchronize Discord slash commands globally or to a specific guild."
-                ).set_footer(text="Aliases: s")
-
-                embed.add_field(
-                    name="Usage",
-                    value=(
-                        f"`{ctx.prefix}m tree sync` - Sync globally\n"
-                        f"`{ctx.prefix}m tree sync <guild_id>` - Sync to specific guild"
-                    ),
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Important Notes",
-                    value=(
-                        "• Global sync can take up to 1 hour to propagate\n"
-                        "• Guild sync is immediate\n"
-                        "• Use guild sync for testing new commands"
-                    ),
-                    inline=False
-                )
-
-            elif command in ['reset']:
-                embed = InfoEmbed(
-                    "Reset Command Tree",
-                    "Clear all Discord slash commands and re-sync."
-                ).set_footer(text="Aliases: r")
-
-                embed.add_field(
-                    name="Usage",
-                    value=(
-                        f"`{ctx.prefix}m tree reset` - Reset globally\n"
-                        f"`{ctx.prefix}m tree reset <guild_id>` - Reset for specific guild"
-                    ),
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="⚠️ Warning",
-                    value="This will remove ALL slash commands before re-syncing. Use with caution!",
-                    inline=False
-                )
-
-            elif command in ['list_tree', 'list tree', 'tree list']:
-                embed = InfoEmbed(
-                    "List Tree Commands",
-                    "List all registered Discord slash commands."
-                ).set_footer(text="Aliases: l")
-
-                embed.add_field(
-                    name="Usage",
-                    value=f"`{ctx.prefix}m tree list` (or `m t l`)",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Functionality",
-                    value="Groups all commands by their cog and shows their description. Automatically splits into multiple messages if the list is too long.",
-                    inline=False
-                )
+            # Specific command help; most invocations are already normalized, so only lower/strip on a miss
+            page = _HELP_DISPATCH.get(command)
+            if page is None:
+                command = command.lower().strip()
+                page = _HELP_DISPATCH.get(command)
+
+            if page is not None:
+                title, description, aliases, fields = page
+                embed = InfoEmbed(title, description).set_footer(text=f"Aliases: {aliases}")
+                for name, value in fields:
+                    embed.add_field(name=name, value=_render_help(value, ctx.prefix), inline=False)
 
             else:
                 # Command not found
@@ -1354,11 +1623,7 @@ class Management(ImprovedCog):
                 )
 
                 # Try to suggest similar commands
-                available_commands = [
-                    'help', 'list', 'cog', 'load', 'unload', 'reload',
-                    'tree', 'sync', 'reset'
-                ]
-                suggestions = difflib.get_close_matches(command, available_commands, n=3, cutoff=0.6)
+                suggestions = _close_matches(command, _HELP_COMMANDS, n=3, cutoff=0.6)
 
                 if suggestions:
                     embed.add_field(
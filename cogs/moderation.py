@@ -1,3 +1,6 @@
+import asyncio
+from datetime import timedelta
+
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -5,6 +8,10 @@ from discord.ext import commands
 from cogs.base import CogTemplate, ImprovedCog
 from utilities.embeds import success_embed, error_embed
 
+# Discord's bulk-delete endpoint only accepts messages younger than 14 days
+_BULK_DELETE_MAX_AGE = timedelta(days=14)
+_SINGLE_DELETE_CONCURRENCY = 5
+
 
 class Moderation(ImprovedCog):
     template = CogTemplate(
@@ -30,19 +37,65 @@ class Moderation(ImprovedCog):
         # Defer response because deleting messages might take a moment
         await interaction.response.defer(ephemeral=True)
 
+        # Counts every message actually deleted, so a failure partway through still reports it
+        deleted = 0
         try:
-            deleted = await interaction.channel.purge(limit=amount)
+            channel = interaction.channel
+            cutoff = discord.utils.utcnow() - _BULK_DELETE_MAX_AGE
+            recent, old = [], []
+            async for message in channel.history(limit=amount):
+                (recent if message.created_at > cutoff else old).append(message)
+
+            # One bulk-delete request per 100 messages; the endpoint rejects anything older than 14 days
+            for i in range(0, len(recent), 100):
+                chunk = recent[i:i + 100]
+                await channel.delete_messages(chunk)
+                deleted += len(chunk)
+
+            if old:
+                semaphore = asyncio.Semaphore(_SINGLE_DELETE_CONCURRENCY)
+
+                async def _delete(message: discord.Message) -> None:
+                    nonlocal deleted
+                    async with semaphore:
+                        try:
+                            await message.delete()
+                        except discord.NotFound:
+                            # Someone else deleted it first
+                            return
+                        except discord.HTTPException as e:
+                            if e.status != 429:
+                                raise
+                            # Rate limited past discord.py's own retries; wait out the bucket once
+                            await asyncio.sleep(float(e.response.headers.get("X-RateLimit-Reset-After", 1)))
+                            await message.delete()
+                        deleted += 1
+
+                # The task group cancels the remaining deletes as soon as one fails
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        for message in old:
+                            group.create_task(_delete(message))
+                except ExceptionGroup as eg:
+                    raise eg.exceptions[0]
+
             await interaction.followup.send(
-                embed=success_embed("Purge Successful", f"Deleted **{len(deleted)}** messages.")
+                embed=success_embed("Purge Successful", f"Deleted **{deleted}** messages.")
             )
         except discord.Forbidden:
             await interaction.followup.send(
-                embed=error_embed("Permission Denied", "I do not have permission to delete messages here.")
+                embed=error_embed(
+                    "Permission Denied",
+                    f"I do not have permission to delete messages here. Deleted **{deleted}** messages."
+                )
             )
         except Exception as e:
             self.logger.error(f"Error in purge command: {e}")
             await interaction.followup.send(
-                embed=error_embed("Error", "An unexpected error occurred while purging messages.")
+                embed=error_embed(
+                    "Error",
+                    f"An unexpected error occurred while purging messages. Deleted **{deleted}** messages."
+                )
             )
 
     @app_commands.command(name="kick", description="Kick a user from the server.")
@@ -56,24 +109,32 @@ class Moderation(ImprovedCog):
             )
             return
 
+        # Defer before the API call so a slow kick can't outlive the interaction token
+        await interaction.response.defer()
+
         try:
             await user.kick(reason=reason)
-            await interaction.response.send_message(
-                embed=success_embed(
-                    "User Kicked",
-                    f"**{user}** has been kicked.\n**Reason:** {reason}"
-                )
-            )
-            # Try to DM the user
-            try:
-                await user.send(f"You were kicked from **{interaction.guild.name}** for: {reason}")
-            except discord.Forbidden:
-                pass
         except discord.Forbidden:
-            await interaction.response.send_message(
+            # The first followup inherits the defer's visibility, so drop the public placeholder
+            # first to let the error go out ephemerally
+            await interaction.delete_original_response()
+            await interaction.followup.send(
                 embed=error_embed("Permission Denied", "I do not have permission to kick this user."),
                 ephemeral=True
             )
+            return
+
+        await interaction.followup.send(
+            embed=success_embed(
+                "User Kicked",
+                f"**{user}** has been kicked.\n**Reason:** {reason}"
+            )
+        )
+        # Try to DM the user
+        try:
+            await user.send(f"You were kicked from **{interaction.guild.name}** for: {reason}")
+        except discord.Forbidden:
+            pass
 
     @app_commands.command(name="ban", description="Ban a user from the server.")
     @app_commands.describe(user="The user to ban.", reason="The reason for the ban.")
@@ -86,16 +147,24 @@ class Moderation(ImprovedCog):
             )
             return
 
+        # Defer before the API call so a slow ban can't outlive the interaction token
+        await interaction.response.defer()
+
         try:
             await user.ban(reason=reason)
-            await interaction.response.send_message(
-                embed=success_embed(
-                    "User Banned",
-                    f"**{user}** has been banned.\n**Reason:** {reason}"
-                )
-            )
         except discord.Forbidden:
-            await interaction.response.send_message(
+            # The first followup inherits the defer's visibility, so drop the public placeholder
+            # first to let the error go out ephemerally
+            await interaction.delete_original_response()
+            await interaction.followup.send(
                 embed=error_embed("Permission Denied", "I do not have permission to ban this user."),
                 ephemeral=True
-            )
\ No newline at end of file
+            )
+            return
+
+        await interaction.followup.send(
+            embed=success_embed(
+                "User Banned",
+                f"**{user}** has been banned.\n**Reason:** {reason}"
+            )
+        )
\ No newline at end of file
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import logging
 import re
 from typing import Dict, Iterator, Optional, Tuple, Union, List, Literal
@@ -7,7 +8,52 @@ import discord
 from box import Box
 from discord.ext import commands
 from pydantic import BaseModel, Field, ValidationError
-from ruamel.yaml import YAML
+import yaml
+
+try:
+    # libyaml-backed loader; falls back to the pure-Python one if PyYAML was built without it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+class _Yaml12Loader(_YamlLoader):
+    """
+    Safe loader that resolves plain scalars the way YAML 1.2 does.
+
+    PyYAML follows YAML 1.1, where yes/no/on/off are booleans and 1:30 is a base-60 number.
+    Those are strings in YAML 1.2, so they are kept as strings here.
+    """
+
+
+_YAML_CORE_TAGS = ('tag:yaml.org,2002:bool', 'tag:yaml.org,2002:int', 'tag:yaml.org,2002:float')
+_Yaml12Loader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag not in _YAML_CORE_TAGS]
+    for first, resolvers in _YamlLoader.yaml_implicit_resolvers.items()
+}
+_Yaml12Loader.add_implicit_resolver(
+    'tag:yaml.org,2002:bool',
+    re.compile(r'^(?:true|True|TRUE|false|False|FALSE)$'),
+    list('tTfF')
+)
+# PyYAML's own int and float patterns, minus the sexagesimal (base-60) forms
+_Yaml12Loader.add_implicit_resolver(
+    'tag:yaml.org,2002:int',
+    re.compile(r'^(?:[-+]?0b[0-1_]+|[-+]?0[0-7_]+|[-+]?(?:0|[1-9][0-9_]*)|[-+]?0x[0-9a-fA-F_]+)$'),
+    list('-+0123456789')
+)
+_Yaml12Loader.add_implicit_resolver(
+    'tag:yaml.org,2002:float',
+    re.compile(r'^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?'
+               r'|\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?'
+               r'|[-+]?\.(?:inf|Inf|INF)'
+               r'|\.(?:nan|NaN|NAN))$'),
+    list('-+0123456789.')
+)
+
+
+# Matches a custom emoji mention like <:name:123> or <a:name:123> and captures its ID
+_EMOJI_RE = re.compile(r'<a?:\w+:(\d+)>')
 
 
 # --- Configuration Models ---
@@ -69,6 +115,8 @@ class CogDetails(BaseModel):
     # We use 'alias' because 'class' is a reserved keyword in Python
     class_name: str = Field(..., alias="class")
     enabled: bool
+    # Optional: lets the management cog name a disabled cog without importing its module
+    template_name: Optional[str] = None
 
 
 class Config(BaseModel):
@@ -100,10 +148,9 @@ class EmojiMap:
         if not hasattr(self, 'bot'):
             return emoji_str
 
-        match = re.search(r'<a?:[a-zA-Z0-9_]+:([0-9]+)>$', emoji_str)
+        match = _EMOJI_RE.fullmatch(emoji_str)
         if match:
-            emoji_id = int(match.group(1))
-            emoji_obj = self.bot.get_emoji(emoji_id)
+            emoji_obj = self.bot.get_emoji(int(match.group(1)))
             return emoji_obj if emoji_obj else emoji_str
 
         return emoji_str
@@ -133,10 +180,14 @@ class EmojiMap:
         return alias.lower() in self._aliases
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Box:
     """
     Loads a YAML configuration file, validates it using Pydantic, and returns it as a Box object.
 
+    The result is cached for the lifetime of the process; the Box is frozen, so every caller
+    can share it. Call ``get_config.cache_clear()`` to force the file to be read again.
+
     Returns:
         Box: The configuration as a dot-accessible object.
 
@@ -146,11 +197,10 @@ def get_config() -> Box:
     """
     logger = logging.getLogger("template.configuration")
     file_path = 'configuration/config.yaml'
-    yaml = YAML(typ='safe')
     
     try:
         with open(file_path, 'r', encoding="utf-8") as file:
-            raw_config = yaml.load(file)
+            raw_config = yaml.load(file, Loader=_Yaml12Loader)
             
         if not raw_config:
             logger.critical(f"Error: The config file at '{file_path}' is empty.")
@@ -166,7 +216,7 @@ def get_config() -> Box:
         # Convert back to dict (using aliases to keep 'class' key) and then to Box
         # This ensures the rest of the bot continues to work with Box features
         config_dict = validated_config.model_dump(by_alias=True)
-        config_box = Box(config_dict, frozen_box=True, default_box=True, default_box_attr=None)
+        config_box = Box(config_dict, frozen_box=True)
         
         return config_box
 
@@ -1,10 +1,15 @@
 import logging
+import os
 from typing import List
 from tortoise import Tortoise
+from tortoise.exceptions import OperationalError
 from utilities.config import get_config
 
 logger = logging.getLogger("template.database")
 
+# Records the database and tables the last schema generation created, so restarts can skip the DDL
+SCHEMA_SENTINEL = ".schema_initialized"
+
 
 async def init_database(modules: List[str] = None):
     """
@@ -13,6 +18,11 @@ async def init_database(modules: List[str] = None):
     Args:
         modules: A list of python modules (paths) that contain your Tortoise Models.
                  Example: ["cogs.economy.models", "cogs.leveling.models"]
+
+    Schemas are only generated when the database URL or the registered tables differ from
+    those recorded in SCHEMA_SENTINEL, or when the database no longer has those tables
+    (e.g. it was dropped and recreated). Set BOT_INIT_SCHEMA=1 (or delete the sentinel)
+    to force generation.
     """
     config = get_config()
 
@@ -27,19 +37,69 @@ async def init_database(modules: List[str] = None):
     if modules is None:
         modules = []
 
+    # Check before connecting, since opening an SQLite connection creates the file
+    db_missing = _sqlite_file_missing(db_url)
+
     try:
         await Tortoise.init(
             db_url=db_url,
             modules={'models': modules}
         )
-        # Generate the schema (create tables) if they don't exist
-        await Tortoise.generate_schemas()
-        logger.info("Database initialized and schemas generated successfully.")
+        # Generate the schema (create tables) only when the database or its tables changed,
+        # or it was requested explicitly
+        schema_key = _schema_key(db_url)
+        if (os.getenv("BOT_INIT_SCHEMA", "0") == "1" or db_missing or _read_sentinel() != schema_key
+                or not await _tables_present()):
+            await Tortoise.generate_schemas(safe=True)
+            with open(SCHEMA_SENTINEL, 'w', encoding="utf-8") as file:
+                file.write(schema_key)
+            logger.info("Database initialized and schemas generated successfully.")
+        else:
+            logger.info("Database initialized (schemas already generated).")
     except Exception as e:
         logger.critical(f"Failed to initialize database: {e}")
         raise
 
 
+def _schema_key(db_url: str) -> str:
+    """Returns a key identifying the database URL and every table registered with Tortoise."""
+    tables = sorted(
+        model._meta.db_table
+        for app_models in Tortoise.apps.values()
+        for model in app_models.values()
+    )
+    return "\n".join([db_url, *tables])
+
+
+async def _tables_present() -> bool:
+    """Returns True if the first registered model's table exists, so a recreated database isn't trusted blindly."""
+    model = next((model for app_models in Tortoise.apps.values() for model in app_models.values()), None)
+    if model is None:
+        return True
+    try:
+        await model.exists()
+    except OperationalError:
+        return False
+    return True
+
+
+def _sqlite_file_missing(db_url: str) -> bool:
+    """Returns True if db_url points at an SQLite file that doesn't exist (e.g. it was deleted)."""
+    if not db_url.startswith("sqlite://"):
+        return False
+    path = db_url[len("sqlite://"):]
+    return path != ":memory:" and not os.path.exists(path)
+
+
+def _read_sentinel() -> str | None:
+    """Returns the key recorded by the last schema generation, or None if there was none."""
+    try:
+        with open(SCHEMA_SENTINEL, 'r', encoding="utf-8") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
 async def close_database():
     """Closes the Tortoise ORM connection."""
     try:
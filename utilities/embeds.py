@@ -1,43 +1,126 @@
+import functools
+
 import discord
-from typing import Optional, Union, List, Dict, Any
-from datetime import datetime
+from typing import Optional, Union, List, Dict, Any, Tuple
+from datetime import datetime, timezone
 from utilities.config import get_config
 
+# Fallback colors and emojis if config is not available
+_FALLBACK_COLORS: Dict[str, int] = {
+    'default': 0x5865F2,
+    'success': 0x57F287,
+    'error': 0xED4245,
+    'warning': 0xFEE75C,
+    'info': 0x539bf5
+}
+_FALLBACK_EMOJIS: Dict[str, str] = {
+    'loading': '⏳',
+    'success': '✅',
+    'error': '❌',
+    'info': 'ℹ️'
+}
+
+# (config, colors, emojis) for the most recently seen config object, so the style
+# tables are only extracted again when a different config is passed in
+_style_cache: Tuple[Any, Dict[str, int], Dict[str, str]] = (None, {}, {})
+
+
+def _style_tables(config) -> Tuple[Dict[str, int], Dict[str, str]]:
+    """Return the color and emoji lookup tables for a config, building them once per config object."""
+    global _style_cache
+    cached_config, colors, emojis = _style_cache
+    if cached_config is config:
+        return colors, emojis
+
+    try:
+        colors = dict(config.style.embed_colors)
+    except (AttributeError, KeyError, TypeError):
+        colors = _FALLBACK_COLORS
+    try:
+        emojis = dict(config.style.emojis)
+    except (AttributeError, KeyError, TypeError):
+        emojis = _FALLBACK_EMOJIS
+
+    _style_cache = (config, colors, emojis)
+    return colors, emojis
+
+
+@functools.lru_cache(maxsize=256)
+def _prefixed_title(emoji: str, title: str) -> str:
+    """Return the title prefixed with its emoji; cached since most embeds reuse a handful of titles."""
+    return f"{emoji} {title}" if emoji else title
+
+
+@functools.lru_cache(maxsize=4096)
+def _timestamp_tag(dt: datetime, style: str = 'F') -> str:
+    """Return a Discord <t:...> timestamp tag; cached since the same users and guilds are looked up repeatedly."""
+    return f"<t:{int(dt.timestamp())}:{style}>"
+
+
+def _apply_embed_kwargs(embed: discord.Embed, kwargs: Dict[str, Any]) -> None:
+    """Apply additional keyword arguments (fields, footer, author, thumbnail, image) to an embed."""
+    for key, value in kwargs.items():
+        if key == 'fields' and isinstance(value, list):
+            for field in value:
+                if isinstance(field, dict):
+                    embed.add_field(
+                        name=field.get('name', 'Field'),
+                        value=field.get('value', 'Value'),
+                        inline=field.get('inline', False)
+                    )
+        elif key == 'footer':
+            if isinstance(value, dict):
+                embed.set_footer(text=value.get('text', ''), icon_url=value.get('icon_url'))
+            else:
+                embed.set_footer(text=str(value))
+        elif key == 'author':
+            if isinstance(value, dict):
+                embed.set_author(
+                    name=value.get('name', ''),
+                    icon_url=value.get('icon_url'),
+                    url=value.get('url')
+                )
+            else:
+                embed.set_author(name=str(value))
+        elif key == 'thumbnail':
+            embed.set_thumbnail(url=str(value))
+        elif key == 'image':
+            embed.set_image(url=str(value))
+
+
+def _new_embed(config, color: Optional[str] = None, title: Optional[str] = None, emoji: Optional[str] = None,
+               description: Optional[str] = None, timestamp: bool = False) -> discord.Embed:
+    """Create a discord.Embed styled from config. `emoji` names a configured emoji to prefix the title with."""
+    colors, emojis = _style_tables(config)
+    if emoji is not None:
+        title = _prefixed_title(emojis.get(emoji, ""), title)
+    return discord.Embed(
+        colour=colors.get(color, 0x5865F2) if color is not None else None,
+        title=title,
+        description=description or None,
+        timestamp=datetime.now(timezone.utc) if timestamp else None
+    )
+
+
 class BaseEmbedTemplate:
     """Base class for all embed templates with common configuration handling."""
     
-    def __init__(self, config=None):
+    __slots__ = ('config', '_colors', '_emojis', '_embed')
+    
+    def __init__(self, config=None, *, color: Optional[str] = None, title: Optional[str] = None,
+                 emoji: Optional[str] = None, description: Optional[str] = None, timestamp: bool = False):
+        """Create the embed in one constructor call. `emoji` names a configured emoji to prefix the title with."""
         self.config = config or get_config()
-        self._embed = discord.Embed()
+        self._colors, self._emojis = _style_tables(self.config)
+        self._embed = _new_embed(self.config, color, title, emoji, description, timestamp)
     
     def _get_color(self, color_type: str) -> int:
         """Get a color from the configuration or return a default."""
-        try:
-            return self.config.style.embed_colors.get(color_type, 0x5865F2)
-        except (AttributeError, KeyError):
-            # Fallback colors if config is not available
-            fallback_colors = {
-                'default': 0x5865F2,
-                'success': 0x57F287,
-                'error': 0xED4245,
-                'warning': 0xFEE75C,
-                'info': 0x539bf5
-            }
-            return fallback_colors.get(color_type, 0x5865F2)
+        return self._colors.get(color_type, 0x5865F2)
     
     def _get_emoji(self, emoji_name: str) -> str:
         """Get an emoji from the configuration or return a default."""
-        try:
-            return self.config.style.emojis.get(emoji_name, "")
-        except (AttributeError, KeyError):
-            # Fallback emojis if config is not available
-            fallback_emojis = {
-                'loading': '⏳',
-                'success': '✅',
-                'error': '❌',
-                'info': 'ℹ️'
-            }
-            return fallback_emojis.get(emoji_name, "")
+        return self._emojis.get(emoji_name, "")
     
     def set_color(self, color: Union[str, int, discord.Color]) -> 'BaseEmbedTemplate':
         """Set the embed color. Can be a color type string, hex int, or discord.Color."""
@@ -88,39 +171,12 @@ class BaseEmbedTemplate:
     
     def set_timestamp(self, timestamp: Optional[datetime] = None) -> 'BaseEmbedTemplate':
         """Set the embed timestamp. Defaults to current time if None."""
-        self._embed.timestamp = timestamp or datetime.utcnow()
+        self._embed.timestamp = timestamp or datetime.now(timezone.utc)
         return self
     
     def _apply_kwargs(self, kwargs: Dict[str, Any]) -> 'BaseEmbedTemplate':
         """Apply additional keyword arguments to the embed."""
-        for key, value in kwargs.items():
-            if key == 'fields' and isinstance(value, list):
-                for field in value:
-                    if isinstance(field, dict):
-                        self.add_field(
-                            name=field.get('name', 'Field'),
-                            value=field.get('value', 'Value'),
-                            inline=field.get('inline', False)
-                        )
-            elif key == 'footer':
-                if isinstance(value, dict):
-                    self.set_footer(text=value.get('text', ''), icon_url=value.get('icon_url'))
-                else:
-                    self.set_footer(text=str(value))
-            elif key == 'author':
-                if isinstance(value, dict):
-                    self.set_author(
-                        name=value.get('name', ''),
-                        icon_url=value.get('icon_url'),
-                        url=value.get('url')
-                    )
-                else:
-                    self.set_author(name=str(value))
-            elif key == 'thumbnail':
-                self.set_thumbnail(url=str(value))
-            elif key == 'image':
-                self.set_image(url=str(value))
-        
+        _apply_embed_kwargs(self._embed, kwargs)
         return self
     
     def build(self) -> discord.Embed:
@@ -131,101 +187,62 @@ class BaseEmbedTemplate:
 class SuccessEmbed(BaseEmbedTemplate):
     """Template for success embeds with green color and success emoji."""
     
+    __slots__ = ()
+    
     def __init__(self, title: str = "Success", description: str = None, config=None, **kwargs):
-        super().__init__(config)
-        emoji = self._get_emoji('success')
-        formatted_title = f"{emoji} {title}" if emoji else title
-        
-        self.set_color('success')
-        self.set_title(formatted_title)
-        self.set_timestamp()
-        
-        if description:
-            self.set_description(description)
-        
+        super().__init__(config, color='success', title=title, emoji='success', description=description, timestamp=True)
         self._apply_kwargs(kwargs)
 
 
 class ErrorEmbed(BaseEmbedTemplate):
     """Template for error embeds with red color and error emoji."""
     
+    __slots__ = ()
+    
     def __init__(self, title: str = "Error", description: str = None, config=None, **kwargs):
-        super().__init__(config)
-        emoji = self._get_emoji('error')
-        formatted_title = f"{emoji} {title}" if emoji else title
-        
-        self.set_color('error')
-        self.set_title(formatted_title)
-        self.set_timestamp()
-        
-        if description:
-            self.set_description(description)
-        
+        super().__init__(config, color='error', title=title, emoji='error', description=description, timestamp=True)
         self._apply_kwargs(kwargs)
 
 
 class WarningEmbed(BaseEmbedTemplate):
     """Template for warning embeds with yellow color."""
     
+    __slots__ = ()
+    
     def __init__(self, title: str = "Warning", description: str = None, config=None, **kwargs):
-        super().__init__(config)
-        
-        self.set_color('warning')
-        self.set_title(f"⚠️ {title}")
-        self.set_timestamp()
-        
-        if description:
-            self.set_description(description)
-        
+        super().__init__(config, color='warning', title=f"⚠️ {title}", description=description, timestamp=True)
         self._apply_kwargs(kwargs)
 
 
 class InfoEmbed(BaseEmbedTemplate):
     """Template for info embeds with blue color and info emoji."""
     
+    __slots__ = ()
+    
     def __init__(self, title: str = "Information", description: str = None, config=None, **kwargs):
-        super().__init__(config)
-        emoji = self._get_emoji('info')
-        formatted_title = f"{emoji} {title}" if emoji else title
-        
-        self.set_color('info')
-        self.set_title(formatted_title)
-        self.set_timestamp()
-        
-        if description:
-            self.set_description(description)
-        
+        super().__init__(config, color='info', title=title, emoji='info', description=description, timestamp=True)
         self._apply_kwargs(kwargs)
 
 
 class LoadingEmbed(BaseEmbedTemplate):
     """Template for loading embeds with default color and loading emoji."""
     
+    __slots__ = ()
+    
     def __init__(self, title: str = "Loading...", description: str = None, config=None, **kwargs):
-        super().__init__(config)
-        emoji = self._get_emoji('loading')
-        formatted_title = f"{emoji} {title}" if emoji else title
-        
-        self.set_color('default')
-        self.set_title(formatted_title)
-        
-        if description:
-            self.set_description(description)
-        
+        super().__init__(config, color='default', title=title, emoji='loading', description=description)
         self._apply_kwargs(kwargs)
 
 
 class CommandHelpEmbed(BaseEmbedTemplate):
     """Template for command help embeds."""
     
+    __slots__ = ()
+    
     def __init__(self, command_name: str, description: str, usage: str = None, 
                  aliases: List[str] = None, config=None, **kwargs):
-        super().__init__(config)
-        
-        self.set_color('info')
-        self.set_title(f"Command: {command_name}")
-        self.set_description(description)
-        self.set_timestamp()
+        super().__init__(config, color='info', title=f"Command: {command_name}", description=description,
+                         timestamp=True)
         
         if usage:
             self.add_field(name="Usage", value=f"`{usage}`", inline=False)
@@ -239,21 +256,19 @@ class CommandHelpEmbed(BaseEmbedTemplate):
 class UserInfoEmbed(BaseEmbedTemplate):
     """Template for user information embeds."""
     
+    __slots__ = ()
+    
     def __init__(self, user: discord.Member, config=None, **kwargs):
-        super().__init__(config)
-        
-        self.set_color('default')
-        self.set_title("User Information")
+        super().__init__(config, color='default', title="User Information", timestamp=True)
         self.set_thumbnail(user.display_avatar.url)
-        self.set_timestamp()
         
         self.add_field(name="Username", value=str(user), inline=True)
         self.add_field(name="ID", value=str(user.id), inline=True)
-        self.add_field(name="Created", value=f"<t:{int(user.created_at.timestamp())}:F>", inline=False)
-        self.add_field(name="Joined", value=f"<t:{int(user.joined_at.timestamp())}:F>", inline=False)
+        self.add_field(name="Created", value=_timestamp_tag(user.created_at), inline=False)
+        self.add_field(name="Joined", value=_timestamp_tag(user.joined_at), inline=False)
         
         if user.premium_since:
-            self.add_field(name="Nitro Booster Since", value=f"<t:{int(user.premium_since.timestamp())}:F>", inline=False)
+            self.add_field(name="Nitro Booster Since", value=_timestamp_tag(user.premium_since), inline=False)
         
         self._apply_kwargs(kwargs)
 
@@ -261,16 +276,14 @@ class UserInfoEmbed(BaseEmbedTemplate):
 class ServerInfoEmbed(BaseEmbedTemplate):
     """Template for server information embeds."""
     
+    __slots__ = ()
+    
     def __init__(self, guild: discord.Guild, config=None, **kwargs):
-        super().__init__(config)
-        
-        self.set_color('default')
-        self.set_title(f"Server Information: {guild.name}")
-        self.set_timestamp()
+        super().__init__(config, color='default', title=f"Server Information: {guild.name}", timestamp=True)
         
         self.add_field(name="Owner", value=str(guild.owner), inline=True)
         self.add_field(name="Members", value=str(guild.member_count), inline=True)
-        self.add_field(name="Created", value=f"<t:{int(guild.created_at.timestamp())}:F>", inline=False)
+        self.add_field(name="Created", value=_timestamp_tag(guild.created_at), inline=False)
         self.add_field(name="Boost Level", value=str(guild.premium_tier), inline=True)
         self.add_field(name="Boost Count", value=str(guild.premium_subscription_count), inline=True)
         
@@ -283,31 +296,48 @@ class ServerInfoEmbed(BaseEmbedTemplate):
 class CustomEmbed(BaseEmbedTemplate):
     """Template for fully customizable embeds."""
     
+    __slots__ = ()
+    
     def __init__(self, config=None):
-        super().__init__(config)
-        self.set_color('default')
+        super().__init__(config, color='default')
 
 
 # Convenience functions for quick access
+# The simple ones build the discord.Embed directly instead of creating a template only to call build()
 def success_embed(title: str = "Success", description: str = None, config=None, **kwargs) -> discord.Embed:
     """Quick function to create a success embed."""
-    return SuccessEmbed(title, description, config, **kwargs).build()
+    embed = _new_embed(config or get_config(), 'success', title, 'success', description, timestamp=True)
+    if kwargs:
+        _apply_embed_kwargs(embed, kwargs)
+    return embed
 
 def error_embed(title: str = "Error", description: str = None, config=None, **kwargs) -> discord.Embed:
     """Quick function to create an error embed."""
-    return ErrorEmbed(title, description, config, **kwargs).build()
+    embed = _new_embed(config or get_config(), 'error', title, 'error', description, timestamp=True)
+    if kwargs:
+        _apply_embed_kwargs(embed, kwargs)
+    return embed
 
 def warning_embed(title: str = "Warning", description: str = None, config=None, **kwargs) -> discord.Embed:
     """Quick function to create a warning embed."""
-    return WarningEmbed(title, description, config, **kwargs).build()
+    embed = _new_embed(config or get_config(), 'warning', f"⚠️ {title}", description=description, timestamp=True)
+    if kwargs:
+        _apply_embed_kwargs(embed, kwargs)
+    return embed
 
 def info_embed(title: str = "Information", description: str = None, config=None, **kwargs) -> discord.Embed:
     """Quick function to create an info embed."""
-    return InfoEmbed(title, description, config, **kwargs).build()
+    embed = _new_embed(config or get_config(), 'info', title, 'info', description, timestamp=True)
+    if kwargs:
+        _apply_embed_kwargs(embed, kwargs)
+    return embed
 
 def loading_embed(title: str = "Loading...", description: str = None, config=None, **kwargs) -> discord.Embed:
     """Quick function to create a loading embed."""
-    return LoadingEmbed(title, description, config, **kwargs).build()
+    embed = _new_embed(config or get_config(), 'default', title, 'loading', description)
+    if kwargs:
+        _apply_embed_kwargs(embed, kwargs)
+    return embed
 
 def command_help_embed(command_name: str, description: str, usage: str = None, 
                       aliases: List[str] = None, config=None, **kwargs) -> discord.Embed:
@@ -1,79 +1,194 @@
+import hashlib
+import importlib.metadata
 import logging
 import os
+import re
+import shutil
 import subprocess
 import sys
+import time
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("template.requirements")
 
+# Stamps recording the last successful install, so unchanged requirements skip pip on startup
+STAMP_DIR = ".requirements_cache"
+PIP_UPDATE_INTERVAL = 30 * 24 * 60 * 60  # seconds
+
+# The distribution name at the start of a requirement line (before extras, versions or markers)
+_REQUIREMENT_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+def _stamp_path(name: str) -> str:
+    return os.path.join(STAMP_DIR, f"{name}.stamp")
+
+
+def _requirements_hash(filename: str) -> str:
+    """
+    Hash a requirements file together with the interpreter it is installed into.
+
+    Args:
+        filename (str): The requirements file to hash.
+
+    Returns:
+        str: A hex digest that changes if the file or the Python environment changes.
+    """
+    with open(filename, 'rb') as file:
+        digest = hashlib.blake2b(file.read(), digest_size=16)
+    digest.update(sys.executable.encode())
+    return digest.hexdigest()
+
+
+def _requirements_installed(filename: str) -> bool:
+    """
+    Check that every package named in a requirements file is installed in this environment.
+
+    The stamp alone can't tell a venv that was deleted and recreated at the same path from the
+    one it was written for, so this confirms the packages are actually there before trusting it.
+
+    Args:
+        filename (str): The requirements file to check.
+
+    Returns:
+        bool: True if every named package is installed, False otherwise.
+    """
+    with open(filename, 'r', encoding="utf-8") as file:
+        for line in file:
+            line = line.split("#", 1)[0].strip()
+            # Options like -r/-e/--index-url don't name a package
+            if not line or line.startswith("-"):
+                continue
+            match = _REQUIREMENT_NAME.match(line)
+            if not match:
+                continue
+            try:
+                importlib.metadata.version(match.group())
+            except importlib.metadata.PackageNotFoundError:
+                return False
+    return True
+
+
+def _read_stamp(name: str) -> str | None:
+    try:
+        with open(_stamp_path(name), 'r', encoding="utf-8") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write_stamp(name: str, value: str) -> None:
+    os.makedirs(STAMP_DIR, exist_ok=True)
+    with open(_stamp_path(name), 'w', encoding="utf-8") as file:
+        file.write(value)
+
 
 def run_command(command: list) -> bool:
     """
-    Executes a command using the current Python interpreter's pip.
+    Executes an installer command.
 
     Args:
-        command (list): The command to run as a list of strings.
+        command (list): The full command to run as a list of strings.
 
     Returns:
         bool: True if the command was successful, False otherwise.
     """
     try:
-        # Use sys.executable to ensure we're using the pip from the correct Python env
-        result = subprocess.run(
-            [sys.executable, "-m"] + command,
-            check=True,  # Raises CalledProcessError if command returns a non-zero exit code
-            capture_output=True,
-            text=True,  # Captures output as a string
-            encoding='utf-8'
+        # Output is not captured so the installer's progress streams to the console as it happens
+        subprocess.run(
+            command,
+            check=True  # Raises CalledProcessError if command returns a non-zero exit code
         )
-        if result.stdout:
-            logger.info(result.stdout)
-        if result.stderr:
-            # pip often uses stderr for warnings or notices, so we'll print it
-            logger.info(f"Notices/Warnings:\n{result.stderr}")
         return True
     except FileNotFoundError:
-        logger.info(f"Command not found. Is '{sys.executable}' a valid Python interpreter?")
+        logger.info(f"Command not found: '{command[0]}'")
         return False
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error executing: {' '.join(command)}")
-        logger.error(f"STDERR:\n{e.stderr}")
+        logger.error(f"Error executing: {' '.join(command)} (exit code {e.returncode})")
         return False
 
 
+def pip_install_command(args: list) -> list:
+    """
+    Build an install command for the current Python environment, preferring uv when it is on PATH.
+
+    Args:
+        args (list): Arguments to pass after 'install'.
+
+    Returns:
+        list: The full command to hand to run_command.
+    """
+    uv = shutil.which("uv")
+    if uv:
+        # uv's resolver and parallel downloads are far faster than pip's; --python targets this env
+        return [uv, "pip", "install", "--python", sys.executable] + args
+    # Use sys.executable to ensure we're using the pip from the correct Python env
+    return [sys.executable, "-m", "pip", "install", "--upgrade-strategy", "only-if-needed"] + args
+
+
 def update_pip() -> bool:
     """
     Updates pip to the latest version.
     :return:
     """
+    try:
+        if time.time() - os.path.getmtime(_stamp_path("pip")) < PIP_UPDATE_INTERVAL:
+            logger.info("pip was updated recently, skipping.")
+            return True
+    except OSError:
+        pass
+
     logger.info("Updating pip...")
-    command = ["pip", "install", "--upgrade", "pip"]
-    return run_command(command)
+    command = [sys.executable, "-m", "pip", "install", "--upgrade", "pip"]
+    if not run_command(command):
+        return False
+    _write_stamp("pip", sys.executable)
+    return True
 
 
-def install_requirements(filename: str) -> bool:
+def install_requirements(filenames: list[str]) -> bool:
     """
-    Install packages from a template_requirements.txt file.
-    :param filename: the filename of the template_requirements.txt file
-    :return: Nothing
+    Install packages from requirements files in a single pip invocation, so pip resolves them together.
+    Files that are missing or unchanged since their last successful install are skipped.
+    :param filenames: the requirements files to install
+    :return: True if every existing file is installed, False otherwise
     """
-    if not os.path.exists(filename):
-        logger.warning(f"Could not find requirements file '{filename}'. Skipping package installation.")
+    success = True
+    pending = {}
+    for filename in filenames:
+        if not os.path.exists(filename):
+            logger.warning(f"Could not find requirements file '{filename}'. Skipping package installation.")
+            success = False
+            continue
+
+        requirements_hash = _requirements_hash(filename)
+        if _read_stamp(filename) == requirements_hash and _requirements_installed(filename):
+            logger.info(f"Requirements in '{filename}' are unchanged since the last install, skipping.")
+            continue
+        pending[filename] = requirements_hash
+
+    if not pending:
+        return success
+
+    logger.info(f"Installing packages from {', '.join(pending)}...")
+    command = pip_install_command([])
+    for filename in pending:
+        command += ["-r", filename]
+    if not run_command(command):
         return False
 
-    command = ["pip", "install", "-r", filename]
-    return run_command(command)
+    for filename, requirements_hash in pending.items():
+        _write_stamp(filename, requirements_hash)
+    return success
 
 
 def ensure_requirements():
-    update_pip()
+    # uv installs without going through pip, so there is no pip to keep current
+    if not shutil.which("uv"):
+        update_pip()
     requirement_files = ["template_requirements.txt", "bot_requirements.txt"]
-    success = True
-    for requirement_file in requirement_files:
-        logger.info(f"Installing packages from {requirement_file}...")
-        if not install_requirements(requirement_file):
-            logger.warning(f"Could not install packages from {requirement_file}. We will still try to run the bot.")
-            success = False
+    success = install_requirements(requirement_files)
     if success:
         logger.info("Requirements are satisfied.")
+    else:
+        logger.warning("Could not install all required packages. We will still try to run the bot.")
     return success
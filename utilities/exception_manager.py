@@ -1,26 +1,44 @@
+import asyncio
 import datetime
 import logging
 import os
 import pprint
+import re
 import traceback
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger("template.exception_manager")
 
-def create_detailed_error_log(log_dir, command_name, exc_type, exc_value, tb):
-    """
-    Catches an exception and logs it to a unique file with
-    a full traceback and variable state.
-    """
+# A single worker keeps log writes in submission order and off the event loop
+_WRITER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="error-log")
 
-    os.makedirs(log_dir, exist_ok=True)
+# Attribute names whose values are redacted from the log
+_is_sensitive = re.compile(r'token|password|secret|api[_-]?key', re.IGNORECASE).search
 
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    log_file = os.path.join(log_dir, f"error_{timestamp}.log")
 
-    tb_lines = traceback.format_exception(exc_type, exc_value, tb)
-    traceback_str = "".join(tb_lines)
+def _format_vars(var_dict):
+    """Format variables for the log, expanding plain objects one level."""
+    formatted_vars = {}
+    for var_name, var_value in var_dict.items():
+        # Avoid logging sensitive data
 
-    variable_state_str = f"Error at {timestamp} in command {command_name}, \n--- VARIABLE STATE (FULL STACK) ---\n"
+        repr_str = repr(var_value)
+        is_default_object = repr_str.startswith('<') and 'object at 0x' in repr_str
+
+        if is_default_object and hasattr(var_value, '__dict__'):
+            formatted_vars[var_name] = {
+                '__type__': str(type(var_value)),
+                '__dict__': {k: ("********" if _is_sensitive(k) else v) for k, v in var_value.__dict__.items()}
+            }
+        else:
+            formatted_vars[var_name] = var_value
+    return formatted_vars
+
+
+def _write_variable_state(f, printer, tb):
+    """Stream the locals and globals of every frame in the traceback into f using printer."""
+    seen_globals = set()
     current_tb = tb
     while current_tb:
         frame = current_tb.tb_frame
@@ -30,56 +48,58 @@ def create_detailed_error_log(log_dir, command_name, exc_type, exc_value, tb):
         func_name = frame.f_code.co_name
         line_no = frame.f_lineno
 
-        variable_state_str += (
-            f"\n--- Frame: {func_name} in {filename} at line {line_no} ---\n"
-        )
-
-        # Function to format variables, expanding objects one level
-        def format_vars(var_dict):
-            formatted_vars = {}
-            for var_name, var_value in var_dict.items():
-                # Avoid logging sensitive data
-
-                repr_str = repr(var_value)
-                is_default_object = repr_str.startswith('<') and 'object at 0x' in repr_str
-
-                if is_default_object and hasattr(var_value, '__dict__'):
-                    formatted_vars[var_name] = {
-                        '__type__': str(type(var_value)),
-                        '__dict__': {k: (v if not any(keyword in k.lower() for keyword in ['token', 'password', 'secret']) else "********") for k, v in var_value.__dict__.items()}
-                    }
-                else:
-                    formatted_vars[var_name] = var_value
-            return formatted_vars
+        f.write(f"\n--- Frame: {func_name} in {filename} at line {line_no} ---\n")
 
         # Pretty-print locals
+        f.write("\n--- Locals ---\n")
         try:
-            variable_state_str += "\n--- Locals ---\n"
-            formatted_locals = format_vars(frame.f_locals)
-            variable_state_str += pprint.pformat(formatted_locals, indent=2, width=120)
+            printer.pprint(_format_vars(frame.f_locals))
         except Exception as e:
-            variable_state_str += f"  [Could not format locals: {e}]\n"
-
-        # Pretty-print globals
-        try:
-            variable_state_str += "\n\n--- Globals ---\n"
-            formatted_globals = format_vars(frame.f_globals)
-            variable_state_str += pprint.pformat(formatted_globals, indent=2, width=120)
-        except Exception as e:
-            variable_state_str += f"  [Could not format globals: {e}]\n"
-
-        variable_state_str += "\n"
+            f.write(f"  [Could not format locals: {e}]\n")
+
+        # Pretty-print globals, once per module since every frame from the same module shares them
+        f.write("\n--- Globals ---\n")
+        module_globals = frame.f_globals
+        if id(module_globals) in seen_globals:
+            f.write(f"  [Same as {module_globals.get('__name__', '<unknown>')} above]\n")
+        else:
+            seen_globals.add(id(module_globals))
+            try:
+                printer.pprint(_format_vars({
+                    name: value for name, value in module_globals.items()
+                    if name != '__builtins__' and not callable(value) and not isinstance(value, types.ModuleType)
+                }))
+            except Exception as e:
+                f.write(f"  [Could not format globals: {e}]\n")
 
         # Move to the next frame up the stack
         current_tb = current_tb.tb_next
 
-    # Write everything to the log file
+
+def create_detailed_error_log(log_dir, command_name, exc_type, exc_value, tb):
+    """
+    Catches an exception and logs it to a unique file with
+    a full traceback and variable state.
+    """
+
+    os.makedirs(log_dir, exist_ok=True)
+
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    log_file = os.path.join(log_dir, f"error_{timestamp}.log")
+
+    tb_lines = traceback.format_exception(exc_type, exc_value, tb)
+    traceback_str = "".join(tb_lines)
+
+    # Write straight to the log file, frame by frame, instead of building the whole state in memory
     try:
         with open(log_file, "w") as f:
             f.write("--- UNCAUGHT EXCEPTION LOG ---\n\n")
             f.write(traceback_str)
             f.write("\n")
-            f.write(variable_state_str)
+            f.write(f"Error at {timestamp} in command {command_name}, \n--- VARIABLE STATE (FULL STACK) ---\n")
+            # One printer for every frame; depth caps how far deep object graphs get expanded
+            printer = pprint.PrettyPrinter(stream=f, indent=2, width=120, depth=3, compact=True)
+            _write_variable_state(f, printer, tb)
 
         logger.error(f"Uncaught exception. Detailed log saved to: {log_file}")
         return log_file
@@ -87,5 +107,15 @@ def create_detailed_error_log(log_dir, command_name, exc_type, exc_value, tb):
     except Exception as e:
         logger.warning(f"Error writing to log file: {e}")
         logger.warning(f"Original traceback:\n{traceback_str}")
-        logger.warning(f"Variable state:\n{variable_state_str}")
-        return None
\ No newline at end of file
+        return None
+
+
+async def create_detailed_error_log_async(log_dir, command_name, exc_type, exc_value, tb):
+    """
+    Same as create_detailed_error_log, but serializes and writes the log on a background
+    thread so a large dump doesn't block the event loop. Formatting the frame variables is
+    the expensive part, so it runs on the thread too, streaming straight into the file.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _WRITER_POOL, create_detailed_error_log, log_dir, command_name, exc_type, exc_value, tb
+    )
@@ -1,3 +1,5 @@
+import asyncio
+
 import discord
 from discord.ext import commands
 from typing import Optional, Union, Any
@@ -5,36 +7,78 @@ import logging
 
 logger = logging.getLogger("helpers")
 
+# Bound once so the per-message paths skip the discord module attribute lookups
+_Interaction = discord.Interaction
+_NotFound = discord.NotFound
+_Forbidden = discord.Forbidden
+_HTTPException = discord.HTTPException
 
-def _prepare_kwargs(
-        content: str = None,
-        embed: discord.Embed = None,
-        view: discord.ui.View = None,
-        file: discord.File = None,
-        files: list[discord.File] = None,
-        attachments: list[discord.Attachment] = None,
-        delete_after: int | None = None,
-        **other_kwargs
-) -> dict[str, Any]:
-    """Prepare a dictionary of keyword arguments for a Discord message."""
-    kwargs: dict[str, Any] = {
-        'content': content,
-        'embed': embed,
-        'view': view,
-        'delete_after': delete_after,
-    }
-    kwargs.update(other_kwargs)
+# Failures send()/edit() log and turn into None; anything else (including bugs) propagates
+_SEND_ERRORS = (discord.DiscordException, asyncio.TimeoutError)
 
-    if file:
-        kwargs['file'] = file
-    elif files:
-        kwargs['files'] = files
+# Strong references to fire-and-forget tasks, which asyncio would otherwise only hold weakly
+_background_tasks: set[asyncio.Task] = set()
 
-    if attachments is not None:
-        kwargs['attachments'] = attachments
+# Pending debounced edits: message id -> (merged edit() kwargs, future resolved when flushed)
+_pending_edits: dict[int, tuple[dict[str, Any], asyncio.Future]] = {}
+
+
+async def _send_interaction(
+        interaction: discord.Interaction,
+        kwargs: dict[str, Any],
+        reply: bool,
+        delete_original: bool,
+        return_message: bool
+) -> Optional[discord.Message]:
+    """Send for an interaction, picking the initial response or a followup."""
+    # For interactions, reply and delete_original flags are ignored
+    # since interactions don't have a traditional "original message" to reply to or delete
+    response = interaction.response
+    if response.is_done():
+        return await interaction.followup.send(**kwargs)
+    await response.send_message(**kwargs)
+    if return_message:
+        return await interaction.original_response()
+    return None
+
+
+async def _safe_delete(message: discord.Message) -> None:
+    """Delete a message, logging instead of raising if that fails."""
+    try:
+        await message.delete()
+    except (_NotFound, _Forbidden, _HTTPException) as e:
+        logger.warning("Could not delete original message: %s", e)
+
+
+async def _send_context(
+        ctx: commands.Context,
+        kwargs: dict[str, Any],
+        reply: bool,
+        delete_original: bool,
+        return_message: bool
+) -> Optional[discord.Message]:
+    """Send for a commands.Context, optionally replying to or deleting the invoking message."""
+    # Delete the original in the background so the response doesn't wait on that round trip
+    if delete_original:
+        task = asyncio.create_task(_safe_delete(ctx.message))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
-    # Remove None values (but keep empty lists/discord.MISSING)
-    return {k: v for k, v in kwargs.items() if v is not None}
+    # Remove ephemeral from kwargs since Context doesn't support it
+    if kwargs.pop('ephemeral', None) is not None and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Ephemeral flag ignored for context-based message (not supported)")
+
+    # Handle reply flag
+    if reply and not delete_original:  # Can't reply to a deleted message
+        return await ctx.reply(**kwargs)
+    return await ctx.send(**kwargs)
+
+
+# Sender per concrete target type, so the common cases skip isinstance
+_SEND_DISPATCH = {
+    discord.Interaction: _send_interaction,
+    commands.Context: _send_context,
+}
 
 
 async def send(
@@ -42,6 +86,7 @@ async def send(
         content: str = None,
         *,
         embed: discord.Embed = None,
+        embeds: list[discord.Embed] = None,
         view: discord.ui.View = None,
         file: discord.File = None,
         files: list[discord.File] = None,
@@ -49,6 +94,7 @@ async def send(
         delete_after: int | None = None,
         reply: bool = False,
         delete_original: bool = False,
+        return_message: bool = False,
 ) -> Optional[discord.Message]:
     """
     Respond to an interaction or context with an ephemeral message.
@@ -58,6 +104,7 @@ async def send(
         interaction_or_ctx: Discord interaction or commands context
         content: Message content
         embed: Discord embed
+        embeds: Multiple Discord embeds, sent in one message (ignored if embed is given)
         view: Discord view with components
         file: Single file attachment
         files: Multiple file attachments
@@ -65,50 +112,42 @@ async def send(
         delete_after: how long to delete the message after sending it (default None)
         reply: Whether to reply to the original message (only for Context, ignored for Interactions)
         delete_original: Whether to delete the original message (only for Context, ignored for Interactions)
+        return_message: Whether to fetch the message for an initial interaction response, which costs an
+            extra API call (default False). Followups and Context sends always return the message.
 
     Returns:
         The sent message if possible, None otherwise
     """
-    kwargs: dict[str, Any] = _prepare_kwargs(
-        content=content,
-        embed=embed,
-        view=view,
-        file=file,
-        files=files,
-        delete_after=delete_after,
-        ephemeral=ephemeral
-    )
+    # Only include what was given (None is dropped, but empty lists/discord.MISSING are kept)
+    kwargs: dict[str, Any] = {'ephemeral': ephemeral}
+    if content is not None:
+        kwargs['content'] = content
+    if embed is not None:
+        kwargs['embed'] = embed
+    elif embeds:
+        kwargs['embeds'] = embeds
+    if view is not None:
+        kwargs['view'] = view
+    if file:
+        kwargs['file'] = file
+    elif files:
+        # A one-element list goes through discord.py's single-file path
+        if len(files) == 1:
+            kwargs['file'] = files[0]
+        else:
+            kwargs['files'] = files
+    if delete_after is not None:
+        kwargs['delete_after'] = delete_after
 
-    try:
-        if isinstance(interaction_or_ctx, discord.Interaction):
-            # For interactions, reply and delete_original flags are ignored
-            # since interactions don't have a traditional "original message" to reply to or delete
-            if interaction_or_ctx.response.is_done():
-                return await interaction_or_ctx.followup.send(**kwargs)
-            else:
-                await interaction_or_ctx.response.send_message(**kwargs)
-                return await interaction_or_ctx.original_response()
-        else:  # commands.Context
-            # Handle delete_original flag first (before sending response)
-            if delete_original:
-                try:
-                    await interaction_or_ctx.message.delete()
-                except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
-                    logger.warning(f"Could not delete original message: {e}")
-
-            # Remove ephemeral from kwargs since Context doesn't support it
-            if 'ephemeral' in kwargs:
-                del kwargs['ephemeral']
-                logger.debug("Ephemeral flag ignored for context-based message (not supported)")
-
-            # Handle reply flag
-            if reply and not delete_original:  # Can't reply to a deleted message
-                return await interaction_or_ctx.reply(**kwargs)
-            else:
-                return await interaction_or_ctx.send(**kwargs)
+    # Exact type lookup first; isinstance only runs for subclasses
+    sender = _SEND_DISPATCH.get(type(interaction_or_ctx))
+    if sender is None:
+        sender = _send_interaction if isinstance(interaction_or_ctx, _Interaction) else _send_context
 
-    except Exception as e:
-        logger.error(f"Failed to send response: {e}")
+    try:
+        return await sender(interaction_or_ctx, kwargs, reply, delete_original, return_message)
+    except _SEND_ERRORS as e:
+        logger.error("Failed to send response: %s", e)
         return None
 
 
@@ -131,31 +170,119 @@ async def edit(
         content: New message content
         embed: New Discord embed
         view: New Discord view with components
-        file: Single file attachment
-        files: Multiple file attachments
-        attachments: List of attachments to keep (discord.MISSING to remove all)
+        file: Single file to upload
+        files: Multiple files to upload
+        attachments: List of attachments to keep (all current ones are kept when files are added without it)
         delete_after: How long to delete the message after editing it (default None)
 
     Returns:
         The edited message if possible, None otherwise
     """
-    kwargs: dict[str, Any] = _prepare_kwargs(
-        content=content,
-        embed=embed,
-        view=view,
-        file=file,
-        files=files,
-        attachments=attachments,
-        delete_after=delete_after
-    )
+    # Only include what was given (None is dropped, but empty lists/discord.MISSING are kept)
+    kwargs: dict[str, Any] = {}
+    if content is not None:
+        kwargs['content'] = content
+    if embed is not None:
+        kwargs['embed'] = embed
+    if view is not None:
+        kwargs['view'] = view
+    new_files = [file] if file else files or []
+    if new_files:
+        # Message.edit only takes new files through attachments, next to the ones being kept
+        # (all of the current ones unless attachments says otherwise)
+        kept = message.attachments if attachments is None or attachments is discord.MISSING else attachments
+        kwargs['attachments'] = [*kept, *new_files]
+    elif attachments is not None:
+        kwargs['attachments'] = attachments
+    if delete_after is not None:
+        kwargs['delete_after'] = delete_after
 
     try:
         return await message.edit(**kwargs)
-    except Exception as e:
-        logger.error(f"Failed to edit message: {e}")
+    except _SEND_ERRORS as e:
+        logger.error("Failed to edit message: %s", e)
         return None
 
 
+async def _flush_edit(message: discord.Message, delay: float) -> None:
+    """Wait out the debounce window, then apply every edit merged into it with one request."""
+    pending = _pending_edits[message.id]
+    kwargs, future = pending
+    try:
+        await asyncio.sleep(delay)
+        # Close the window before sending, so edits made meanwhile open a new one
+        del _pending_edits[message.id]
+        result = await edit(message, **kwargs)
+    except BaseException as e:
+        # Don't leave the callers waiting on a future that will never resolve
+        if _pending_edits.get(message.id) is pending:
+            del _pending_edits[message.id]
+        if not future.done():
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+        raise
+    if not future.done():
+        future.set_result(result)
+
+
+def _flush_edit_done(task: asyncio.Task) -> None:
+    """Release a finished flush task and retrieve its exception, so an edit nobody awaited isn't lost."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Debounced edit failed", exc_info=task.exception())
+
+
+async def edit_debounced(
+        message: discord.Message,
+        content: str = None,
+        *,
+        embed: discord.Embed = None,
+        view: discord.ui.View = None,
+        attachments: list[discord.Attachment] = None,
+        interval: float = 0.25,
+) -> Optional[discord.Message]:
+    """
+    Edit a message, coalescing rapid successive edits into a single request.
+
+    The first call opens a window of `interval` seconds; later calls within it override the
+    pending values and all of them resolve together once the merged edit has been sent. Useful
+    for progress updates that would otherwise fire an edit (and risk a 429) on every step.
+
+    Args:
+        message: The discord.Message object to edit.
+        content: New message content
+        embed: New Discord embed
+        view: New Discord view with components
+        attachments: List of attachments to keep (an empty list removes all of them)
+        interval: How long to collect edits before sending them, in seconds (default 0.25)
+
+    Returns:
+        The edited message if possible, None otherwise
+    """
+    pending = _pending_edits.get(message.id)
+    if pending is None:
+        pending = ({}, asyncio.get_running_loop().create_future())
+        _pending_edits[message.id] = pending
+        task = asyncio.create_task(_flush_edit(message, interval))
+        _background_tasks.add(task)
+        task.add_done_callback(_flush_edit_done)
+
+    kwargs, future = pending
+    if content is not None:
+        kwargs['content'] = content
+    if embed is not None:
+        kwargs['embed'] = embed
+    if view is not None:
+        kwargs['view'] = view
+    if attachments is not None:
+        kwargs['attachments'] = attachments
+
+    # Shield so one cancelled caller doesn't cancel the result for everyone else in the window
+    return await asyncio.shield(future)
+
+
 async def edit_or_send(
         interaction_or_ctx: Union[discord.Interaction, commands.Context],
         message_to_edit: Optional[discord.Message] = None,
@@ -167,6 +294,7 @@ async def edit_or_send(
         files: list[discord.File] = None,
         ephemeral: bool = True,
         delete_after: int | None = None,
+        return_message: bool = False,
 ) -> Optional[discord.Message]:
     """
     Edit an existing message if provided, otherwise send a new one.
@@ -182,6 +310,7 @@ async def edit_or_send(
         files: Multiple file attachments
         ephemeral: Whether new messages should be ephemeral (ignored for edits)
         delete_after: How long to delete the message after sending/editing it
+        return_message: Whether a new interaction response should be fetched and returned (see send)
 
     Returns:
         The edited or sent message if possible, None otherwise
@@ -205,5 +334,53 @@ async def edit_or_send(
             file=file,
             files=files,
             ephemeral=ephemeral,
-            delete_after=delete_after
-        )
\ No newline at end of file
+            delete_after=delete_after,
+            return_message=return_message
+        )
+
+
+def _collect_results(results: list, action: str) -> list:
+    """Map gather() exceptions to None, logging unexpected ones and re-raising cancellation."""
+    collected = []
+    for result in results:
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            # send()/edit() already handle Discord errors, so anything here is a bug worth a traceback
+            logger.error("Unexpected error in %s_many", action, exc_info=result)
+            collected.append(None)
+        else:
+            collected.append(result)
+    return collected
+
+
+async def send_many(targets: list[dict[str, Any]]) -> list[Optional[discord.Message]]:
+    """
+    Send several independent messages concurrently.
+
+    discord.py still serializes requests that share a rate-limit bucket (e.g. the same channel),
+    but sends to different channels or DMs overlap instead of waiting on each other. Don't pass
+    the same interaction twice: both sends could see the response as not done yet.
+
+    Args:
+        targets: Keyword arguments for each send() call, including interaction_or_ctx
+
+    Returns:
+        The sent messages (or None for failures), in the same order as targets
+    """
+    results = await asyncio.gather(*(send(**target) for target in targets), return_exceptions=True)
+    return _collect_results(results, "send")
+
+
+async def edit_many(targets: list[dict[str, Any]]) -> list[Optional[discord.Message]]:
+    """
+    Edit several independent messages concurrently.
+
+    Args:
+        targets: Keyword arguments for each edit() call, including message
+
+    Returns:
+        The edited messages (or None for failures), in the same order as targets
+    """
+    results = await asyncio.gather(*(edit(**target) for target in targets), return_exceptions=True)
+    return _collect_results(results, "edit")